@@ -46,7 +46,7 @@ from georisk.config import get_config, reload_config
 from georisk.db.client import ApiClient, ProcessingStatus
 from georisk.raster.change import detect_changes
 from georisk.raster.ndvi import calculate_ndvi_from_scene
-from georisk.risk.proximity import find_nearby_assets
+from georisk.risk.proximity import batch_proximity_analysis
 from georisk.risk.scoring import RiskScorer
 from georisk.stac.search import find_scene_pair, search_scenes
 from georisk.storage.minio import MinioStorage
@@ -499,7 +499,7 @@ def process(
                 try:
                     from georisk.raster.change import _classify_change
                     from georisk.raster.landcover import (
-                        classify_polygon_landcover,
+                        classify_polygons_landcover,
                         is_landcover_available,
                         load_eurosat_model,
                         load_scene_bands,
@@ -510,11 +510,13 @@ def process(
                         scene_bands = load_scene_bands(before_scene, bbox)
 
                         if scene_bands is not None:
+                            results = classify_polygons_landcover(
+                                scene_bands,
+                                [change.geometry for change in changes.polygons],
+                                model,
+                            )
                             classified_count = 0
-                            for change in changes.polygons:
-                                result = classify_polygon_landcover(
-                                    scene_bands, change.geometry, model
-                                )
+                            for change, result in zip(changes.polygons, results):
                                 if result is not None:
                                     change.land_cover_class = result.dominant_class
                                     change.ml_confidence = result.confidence
@@ -570,13 +572,15 @@ def process(
                 try:
                     from georisk.raster.landslide import (
                         LANDSLIDE_SENTINEL_BANDS,
-                        classify_polygon_landslide,
+                        classify_polygons_landslide,
                         is_landslide_available,
                         load_landslide_model,
                     )
 
                     if is_landslide_available():
-                        ls_model = load_landslide_model()
+                        ls_model = load_landslide_model(
+                            compile_model=get_config().ml.landslide_compile,
+                        )
 
                         # Load 12-band scene for landslide model (excludes B8A,
                         # different from landcover's 13 bands)
@@ -586,21 +590,25 @@ def process(
                         )
 
                         if ls_scene_bands is not None:
-                            candidates = 0
+                            steep_changes = [
+                                change for change in changes.polygons
+                                if (change.slope_degree_mean or 0) >= 10.0
+                            ]
+                            ls_results = classify_polygons_landslide(
+                                ls_scene_bands,
+                                dem_data,
+                                [change.geometry for change in steep_changes],
+                                ls_model,
+                            )
                             landslide_count = 0
-                            for change in changes.polygons:
-                                if (change.slope_degree_mean or 0) >= 10.0:
-                                    candidates += 1
-                                    result = classify_polygon_landslide(
-                                        ls_scene_bands, dem_data, change.geometry, ls_model,
-                                    )
-                                    if result is not None and result.is_landslide:
-                                        change.change_type = "LandslideDebris"
-                                        change.ml_confidence = result.landslide_probability
-                                        change.ml_model_version = result.model_version
-                                        landslide_count += 1
+                            for change, result in zip(steep_changes, ls_results):
+                                if result is not None and result.is_landslide:
+                                    change.change_type = "LandslideDebris"
+                                    change.ml_confidence = result.landslide_probability
+                                    change.ml_model_version = result.model_version
+                                    landslide_count += 1
                             click.echo(
-                                f"  Analyzed {candidates} steep-terrain polygons, "
+                                f"  Analyzed {len(steep_changes)} steep-terrain polygons, "
                                 f"classified {landslide_count} as landslides"
                             )
                         else:
@@ -662,6 +670,15 @@ def process(
             scorer = RiskScorer()
             risk_events = []
 
+            # Index the assets once and pass DEM data for directional terrain analysis
+            nearby_by_polygon = batch_proximity_analysis(
+                [change.geometry for change in changes.polygons],
+                assets,
+                max_distance_m=proximity_distance,
+                dem_data=dem_data,
+                change_elevations=[change.elevation_m for change in changes.polygons],
+            )
+
             for polygon_index, change in enumerate(changes.polygons):
                 # Map polygon to its created ID (by index)
                 polygon_id = (
@@ -669,15 +686,7 @@ def process(
                     if polygon_index < len(created_polygon_ids)
                     else None
                 )
-                # Pass DEM data for directional terrain analysis
-                nearby = find_nearby_assets(
-                    change.geometry,
-                    assets,
-                    max_distance_m=proximity_distance,
-                    dem_data=dem_data,
-                    change_elevation_m=change.elevation_m,
-                )
-                for prox in nearby:
+                for prox in nearby_by_polygon.get(polygon_index, []):
                     score = scorer.calculate_risk_score(change, prox)
                     risk_events.append({
                         "changePolygonId": polygon_id,
@@ -3,7 +3,7 @@
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 from dotenv import load_dotenv
@@ -75,9 +75,37 @@ class MlConfig:
     landslide_model_path: str | None = None
     landslide_confidence_threshold: float = 0.5
     landslide_slope_threshold_deg: float = 10.0
+    landslide_compile: bool = False  # torch.compile the landslide model at load
     device: str = "auto"  # "cpu", "cuda", "auto"
 
 
+# YAML section -> (Config attribute, [(key, converter)]). Keys match the
+# dataclass field names; a converter of None assigns the raw value.
+_YAML_SCHEMA: dict[str, tuple[str, list[tuple[str, Callable[[Any], Any] | None]]]] = {
+    "stac": ("stac", [
+        ("catalog_url", None),
+        ("collection", None),
+        ("max_cloud_cover", float),
+    ]),
+    "ml": ("ml", [
+        ("enabled", bool),
+        ("landcover_enabled", bool),
+        ("landcover_backbone", None),
+        ("device", None),
+        ("landslide_enabled", bool),
+        ("landslide_model_path", None),
+        ("landslide_confidence_threshold", float),
+        ("landslide_slope_threshold_deg", float),
+        ("landslide_compile", bool),
+    ]),
+    "change_detection": ("processing", [
+        ("ndvi_threshold", float),
+        ("min_area_m2", float),
+        ("temporal_window_days", int),
+    ]),
+}
+
+
 @dataclass
 class Config:
     """Main configuration container."""
@@ -123,42 +151,15 @@ class Config:
 
     def _apply_yaml_config(self, data: dict[str, Any]) -> None:
         """Apply YAML configuration data."""
-        if "stac" in data:
-            stac = data["stac"]
-            if "catalog_url" in stac:
-                self.stac.catalog_url = stac["catalog_url"]
-            if "collection" in stac:
-                self.stac.collection = stac["collection"]
-            if "max_cloud_cover" in stac:
-                self.stac.max_cloud_cover = float(stac["max_cloud_cover"])
-
-        if "ml" in data:
-            ml = data["ml"]
-            if "enabled" in ml:
-                self.ml.enabled = bool(ml["enabled"])
-            if "landcover_enabled" in ml:
-                self.ml.landcover_enabled = bool(ml["landcover_enabled"])
-            if "landcover_backbone" in ml:
-                self.ml.landcover_backbone = ml["landcover_backbone"]
-            if "device" in ml:
-                self.ml.device = ml["device"]
-            if "landslide_enabled" in ml:
-                self.ml.landslide_enabled = bool(ml["landslide_enabled"])
-            if "landslide_model_path" in ml:
-                self.ml.landslide_model_path = ml["landslide_model_path"]
-            if "landslide_confidence_threshold" in ml:
-                self.ml.landslide_confidence_threshold = float(ml["landslide_confidence_threshold"])
-            if "landslide_slope_threshold_deg" in ml:
-                self.ml.landslide_slope_threshold_deg = float(ml["landslide_slope_threshold_deg"])
-
-        if "change_detection" in data:
-            cd = data["change_detection"]
-            if "ndvi_threshold" in cd:
-                self.processing.ndvi_threshold = float(cd["ndvi_threshold"])
-            if "min_area_m2" in cd:
-                self.processing.min_area_m2 = float(cd["min_area_m2"])
-            if "temporal_window_days" in cd:
-                self.processing.temporal_window_days = int(cd["temporal_window_days"])
+        for section_name, (attr, setters) in _YAML_SCHEMA.items():
+            section_data = data.get(section_name)
+            if not section_data:
+                continue
+            target = getattr(self, attr)
+            for key, convert in setters:
+                if key in section_data:
+                    value = section_data[key]
+                    setattr(target, key, convert(value) if convert else value)
 
     def _load_from_env(self) -> None:
         """Override configuration from environment variables."""
@@ -217,6 +218,8 @@ class Config:
             self.ml.landslide_confidence_threshold = float(landslide_threshold)
         if landslide_slope := os.getenv("LANDSLIDE_SLOPE_THRESHOLD_DEG"):
             self.ml.landslide_slope_threshold_deg = float(landslide_slope)
+        if landslide_compile := os.getenv("LANDSLIDE_COMPILE"):
+            self.ml.landslide_compile = landslide_compile.lower() in ("true", "1", "yes")
 
         # Terrain
         if terrain_enabled := os.getenv("TERRAIN_ENABLED"):
@@ -1,14 +1,17 @@
 """HTTP client for the GeoRisk API."""
 
 from enum import IntEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import httpx
 import structlog
 
 from georisk.config import get_config
-from georisk.raster.change import ChangePolygon
+
+if TYPE_CHECKING:
+    # Deferred so health/list commands don't pull in the raster stack
+    from georisk.raster.change import ChangePolygon
 
 logger = structlog.get_logger()
 
@@ -253,7 +256,7 @@ class ApiClient:
     def create_change_polygons(
         self,
         run_id: str | UUID,
-        polygons: list[ChangePolygon] | list[dict[str, Any]],
+        polygons: "list[ChangePolygon] | list[dict[str, Any]]",
     ) -> dict[str, Any]:
         """Create change polygons for a processing run.
 
@@ -264,6 +267,8 @@ class ApiClient:
         Returns:
             Bulk creation result.
         """
+        from georisk.raster.change import ChangePolygon
+
         polygon_data = [
             p.to_dict() if isinstance(p, ChangePolygon) else p
             for p in polygons
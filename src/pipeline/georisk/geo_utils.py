@@ -1,5 +1,10 @@
 """Shared geospatial utility functions."""
 
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import shapely
 from pyproj import CRS, Transformer
 
 
@@ -30,4 +35,86 @@ def get_utm_transformer(lon: float, lat: float) -> Transformer:
         pyproj Transformer from WGS84 to the appropriate UTM zone.
     """
     utm_crs = get_utm_crs(lon, lat)
-    return Transformer.from_crs(4326, utm_crs, always_xy=True)
+    return get_transformer(4326, utm_crs)
+
+
+def get_transformer(src_crs: Any, dst_crs: Any) -> Transformer:
+    """Get a cached always_xy Transformer between two coordinate systems.
+
+    Transformer construction involves PROJ database lookups and costs far
+    more than the handful of points usually transformed, so instances are
+    shared per (source, destination) pair.
+
+    Args:
+        src_crs: Source CRS (EPSG int, string, pyproj or rasterio CRS).
+        dst_crs: Destination CRS (same accepted types).
+
+    Returns:
+        pyproj Transformer from src_crs to dst_crs.
+    """
+    return _cached_transformer(_crs_key(src_crs), _crs_key(dst_crs))
+
+
+def _crs_key(crs: Any) -> int | str:
+    """Reduce a CRS definition to a hashable value pyproj can rebuild it from."""
+    return crs if isinstance(crs, int) else str(crs)
+
+
+@lru_cache(maxsize=64)
+def _cached_transformer(src_crs: int | str, dst_crs: int | str) -> Transformer:
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+def transform_geometries(geometries: np.ndarray, transformer: Transformer) -> np.ndarray:
+    """Reproject an array of shapely geometries with one vectorized transform.
+
+    Args:
+        geometries: Array of shapely geometries.
+        transformer: pyproj Transformer (always_xy) to apply.
+
+    Returns:
+        New array of reprojected geometries; the input array is not modified.
+    """
+    geometries = np.asarray(geometries, dtype=object)
+    if geometries.size == 0:
+        return geometries.copy()
+    coords = shapely.get_coordinates(geometries)
+    xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+    return shapely.set_coordinates(geometries.copy(), np.column_stack([xs, ys]))
+
+
+def patch_centers(raster: Any, geometries: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Find the raster pixel containing each geometry's centroid.
+
+    All centroids are reprojected from WGS84 to the raster's CRS in a single
+    transformer call, then mapped to pixels with the inverse affine transform
+    (which handles both ascending and descending coordinate orders).
+
+    Args:
+        raster: DataArray with a rio accessor and (..., H, W) shape.
+        geometries: Shapely geometries (WGS84).
+
+    Returns:
+        Tuple of (row, col) index arrays, clamped to the raster like a
+        nearest-coordinate lookup, with -1 where the centroid is undefined
+        (e.g. empty geometries).
+    """
+    centroids = shapely.centroid(np.asarray(geometries, dtype=object))
+    # get_x/get_y raise on empty points, so leave empty centroids as NaN
+    present = ~shapely.is_empty(centroids)
+    xs = np.full(len(centroids), np.nan)
+    ys = np.full(len(centroids), np.nan)
+    xs[present] = shapely.get_x(centroids[present])
+    ys[present] = shapely.get_y(centroids[present])
+
+    raster_crs = getattr(raster, "rio", None) and raster.rio.crs
+    if raster_crs and raster_crs.to_epsg() != 4326:
+        xs, ys = get_transformer(4326, raster_crs).transform(xs, ys)
+
+    h, w = raster.shape[-2], raster.shape[-1]
+    cols, rows = ~raster.rio.transform() * (np.asarray(xs), np.asarray(ys))
+
+    valid = np.isfinite(rows) & np.isfinite(cols)
+    rows = np.where(valid, np.clip(np.floor(rows), 0, h - 1), -1).astype(np.intp)
+    cols = np.where(valid, np.clip(np.floor(cols), 0, w - 1), -1).astype(np.intp)
+    return rows, cols
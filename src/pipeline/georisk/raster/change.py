@@ -1,23 +1,37 @@
 """Change detection from NDVI time series."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
+import shapely
 import structlog
 import xarray as xr
 from rasterio import features
-from shapely.geometry import Polygon, shape
+from rasterio.transform import array_bounds
+from scipy import ndimage
+from shapely.geometry import Polygon
 
 from georisk.config import get_config
 from georisk.raster.ndvi import NdviResult
 
 logger = structlog.get_logger()
 
+# Change type string to the int value of the ChangeType enum in the API
+CHANGE_TYPE_CODES: dict[str, int] = {
+    "Unknown": 0,
+    "VegetationLoss": 1,
+    "VegetationGain": 2,
+    "FireBurnScar": 3,
+    "DroughtStress": 4,
+    "AgriculturalChange": 5,
+    "LandslideDebris": 6,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ChangePolygon:
     """A detected change polygon."""
 
@@ -36,17 +50,7 @@ class ChangePolygon:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API submission (camelCase for C# API)."""
-        # Map change type string to int value
-        change_type_map = {
-            "Unknown": 0,
-            "VegetationLoss": 1,
-            "VegetationGain": 2,
-            "FireBurnScar": 3,
-            "DroughtStress": 4,
-            "AgriculturalChange": 5,
-            "LandslideDebris": 6,
-        }
-        change_type_int = change_type_map.get(self.change_type, 0)
+        change_type_int = CHANGE_TYPE_CODES.get(self.change_type, 0)
 
         return {
             "geometry": self.geometry.__geo_interface__,
@@ -82,40 +86,17 @@ class ChangeDetectionResult:
 
     def save_mask_raster(self, output_path: Path) -> Path:
         """Save change mask raster to a GeoTIFF file."""
-        self.change_mask.astype(np.uint8).rio.to_raster(output_path)
+        self.change_mask.astype(np.uint8, copy=False).rio.to_raster(output_path)
         return output_path
 
     def to_geodataframe(self) -> gpd.GeoDataFrame:
         """Convert change polygons to a GeoDataFrame."""
-        if not self.polygons:
-            return gpd.GeoDataFrame(
-                columns=[
-                    "geometry", "area_sq_meters", "ndvi_drop_mean", "ndvi_drop_max",
-                    "change_type", "slope_degree_mean", "slope_degree_max",
-                    "aspect_degrees", "elevation_m", "land_cover_class",
-                    "ml_confidence", "ml_model_version",
-                ],
-                crs="EPSG:4326",
-            )
-
-        records = [
-            {
-                "geometry": p.geometry,
-                "area_sq_meters": p.area_sq_meters,
-                "ndvi_drop_mean": p.ndvi_drop_mean,
-                "ndvi_drop_max": p.ndvi_drop_max,
-                "change_type": p.change_type,
-                "slope_degree_mean": p.slope_degree_mean,
-                "slope_degree_max": p.slope_degree_max,
-                "aspect_degrees": p.aspect_degrees,
-                "elevation_m": p.elevation_m,
-                "land_cover_class": p.land_cover_class,
-                "ml_confidence": p.ml_confidence,
-                "ml_model_version": p.ml_model_version,
-            }
-            for p in self.polygons
-        ]
-        return gpd.GeoDataFrame(records, crs="EPSG:4326")
+        # Build one column per ChangePolygon field rather than a dict per polygon
+        columns = {
+            f.name: [getattr(p, f.name) for p in self.polygons]
+            for f in fields(ChangePolygon)
+        }
+        return gpd.GeoDataFrame(columns, geometry="geometry", crs="EPSG:4326")
 
 
 def detect_changes(
@@ -150,12 +131,15 @@ def detect_changes(
         min_area_m2=min_area,
     )
 
-    # Calculate NDVI difference (after - before)
-    # Negative values indicate vegetation loss
-    ndvi_diff = after_ndvi.data - before_ndvi.data
+    # Align once (a no-op when both scenes share a grid), then work on the
+    # raw buffers: one float32 subtract and one compare into a uint8 mask
+    after_da, before_da = xr.align(after_ndvi.data, before_ndvi.data, join="inner")
+    diff = np.subtract(after_da.values, before_da.values, dtype=np.float32)
+    mask = (diff < threshold).view(np.uint8)
 
-    # Create binary change mask (1 = significant vegetation loss)
-    change_mask = xr.where(ndvi_diff < threshold, 1, 0)
+    # Negative values indicate vegetation loss (1 = significant loss)
+    ndvi_diff = xr.DataArray(diff, coords=after_da.coords, dims=after_da.dims)
+    change_mask = xr.DataArray(mask, coords=after_da.coords, dims=after_da.dims)
 
     # Copy spatial reference
     ndvi_diff = ndvi_diff.rio.write_crs(before_ndvi.crs)
@@ -163,22 +147,24 @@ def detect_changes(
 
     # Vectorize change mask to polygons
     polygons = _vectorize_changes(
-        change_mask=change_mask.values,
-        ndvi_diff=ndvi_diff.values,
+        change_mask=mask,
+        ndvi_diff=diff,
         transform=before_ndvi.transform,
         crs=before_ndvi.crs,
         min_area_m2=min_area,
     )
 
-    # Calculate statistics
-    valid_diff = ndvi_diff.where(ndvi_diff != 0)
+    # Calculate statistics over changed, non-NaN pixels (|NaN| > 0 is False,
+    # so one comparison drops both zeros and nodata)
+    valid_diff = diff[np.abs(diff) > 0]
+    changed_pixels = int(np.count_nonzero(mask))
     stats = {
-        "mean_diff": float(valid_diff.mean().values) if valid_diff.any() else 0,
-        "min_diff": float(valid_diff.min().values) if valid_diff.any() else 0,
-        "max_diff": float(valid_diff.max().values) if valid_diff.any() else 0,
-        "changed_pixels": int(change_mask.sum().values),
-        "total_pixels": int(change_mask.size),
-        "change_percent": float(change_mask.sum().values / change_mask.size * 100),
+        "mean_diff": float(valid_diff.mean()) if valid_diff.size else 0,
+        "min_diff": float(valid_diff.min()) if valid_diff.size else 0,
+        "max_diff": float(valid_diff.max()) if valid_diff.size else 0,
+        "changed_pixels": changed_pixels,
+        "total_pixels": int(mask.size),
+        "change_percent": float(changed_pixels / mask.size * 100),
     }
 
     logger.info(
@@ -217,8 +203,9 @@ def _vectorize_changes(
     Returns:
         List of ChangePolygon objects (geometries in WGS84/EPSG:4326).
     """
-    from pyproj import CRS, Transformer
-    from shapely.ops import transform as shapely_transform
+    from pyproj import CRS
+
+    from georisk.geo_utils import get_transformer, get_utm_crs, transform_geometries
 
     polygons = []
 
@@ -238,43 +225,61 @@ def _vectorize_changes(
     # Create transformer to WGS84 if needed
     to_wgs84 = None
     if source_crs != wgs84_crs:
-        to_wgs84 = Transformer.from_crs(source_crs, wgs84_crs, always_xy=True)
-
-    # Extract shapes from the mask
+        to_wgs84 = get_transformer(source_crs, wgs84_crs)
+
+    # For a geographic CRS, measure areas in the single UTM zone at the
+    # center of the raster
+    to_utm = None
+    if not is_projected:
+        west, south, east, north = array_bounds(*change_mask.shape, transform)
+        to_utm = get_transformer(source_crs, get_utm_crs((west + east) / 2, (south + north) / 2))
+
+    # Label connected change regions once. ndimage.label's default structure
+    # is 4-connected like the shapes tracing below, so each label traces to
+    # exactly one polygon and the shape value is the label index into the
+    # stats. Any nonzero mask value counts as change, so no cast is needed.
+    labels, num_labels = ndimage.label(change_mask)
+    label_stats = _extract_label_stats(ndvi_diff, labels, num_labels)
+
+    # Extract shapes from the labels, then build all polygons in one batch
+    rings = []
+    shape_labels = []
     for geom, value in features.shapes(
-        change_mask.astype(np.uint8),
-        mask=change_mask == 1,
-        transform=transform,
+        labels, mask=labels > 0, connectivity=4, transform=transform
+    ):
+        rings.append(geom["coordinates"])
+        shape_labels.append(int(value))
+    native_polygons = _polygons_from_rings(rings)
+    shape_labels = np.asarray(shape_labels, dtype=np.intp)
+
+    # Calculate areas in square meters and drop polygons below the minimum
+    areas_m2 = _calculate_areas_m2(native_polygons, to_utm)
+    keep = areas_m2 >= min_area_m2
+
+    # Transform the surviving polygons to WGS84 for storage in one batch
+    kept_polygons = native_polygons[keep]
+    if to_wgs84:
+        kept_polygons = transform_geometries(kept_polygons, to_wgs84)
+
+    # NDVI statistics and classification for the surviving regions
+    kept_labels = shape_labels[keep] - 1
+    ndvi_means = label_stats["mean"][kept_labels]
+    ndvi_maxes = label_stats["max"][kept_labels]
+    change_types = _classify_changes(ndvi_means)
+
+    for polygon_wgs84, area_m2, ndvi_mean, ndvi_max, change_type in zip(
+        kept_polygons,
+        areas_m2[keep].tolist(),
+        ndvi_means.tolist(),
+        ndvi_maxes.tolist(),
+        change_types.tolist(),
     ):
-        if value != 1:
-            continue
-
-        # Polygon is in raster's native CRS
-        polygon_native = shape(geom)
-
-        # Calculate area in square meters
-        # If source is already projected (UTM), area is in meters^2
-        # If source is geographic (WGS84), we need to project to UTM
-        area_m2 = _calculate_area_m2(polygon_native, source_crs, is_projected)
-
-        if area_m2 < min_area_m2:
-            continue
-
-        # Extract NDVI statistics within this polygon (in native CRS)
-        ndvi_stats = _extract_polygon_stats(polygon_native, ndvi_diff, transform)
-
-        # Transform polygon to WGS84 for storage
-        if to_wgs84:
-            polygon_wgs84 = shapely_transform(to_wgs84.transform, polygon_native)
-        else:
-            polygon_wgs84 = polygon_native
-
         change_polygon = ChangePolygon(
             geometry=polygon_wgs84,
             area_sq_meters=area_m2,
-            ndvi_drop_mean=ndvi_stats["mean"],
-            ndvi_drop_max=ndvi_stats["max"],
-            change_type=_classify_change(ndvi_stats["mean"]),
+            ndvi_drop_mean=ndvi_mean,
+            ndvi_drop_max=ndvi_max,
+            change_type=change_type,
         )
         polygons.append(change_polygon)
 
@@ -282,66 +287,91 @@ def _vectorize_changes(
     return polygons
 
 
-def _calculate_area_m2(polygon: Polygon, crs: Any, is_projected: bool) -> float:
-    """Calculate polygon area in square meters.
+def _polygons_from_rings(rings: list[list[list[tuple[float, float]]]]) -> np.ndarray:
+    """Build polygons from GeoJSON ring coordinates in a single shapely call.
 
     Args:
-        polygon: The polygon geometry (in the source CRS).
-        crs: The source coordinate reference system.
-        is_projected: Whether the CRS is already projected (area in meters).
+        rings: Per-polygon list of rings (exterior first, then holes), as
+            yielded in the "coordinates" of rasterio.features.shapes geometries.
 
     Returns:
-        Area in square meters.
+        Array of shapely Polygons (in the same CRS as the input coordinates).
     """
-    from pyproj import CRS, Transformer
-    from shapely.ops import transform as shapely_transform
+    if not rings:
+        return np.empty(0, dtype=object)
+
+    coords: list[tuple[float, float]] = []
+    ring_offsets = [0]
+    polygon_offsets = [0]
+    for polygon_rings in rings:
+        for ring in polygon_rings:
+            coords.extend(ring)
+            ring_offsets.append(len(coords))
+        polygon_offsets.append(len(ring_offsets) - 1)
+
+    return shapely.from_ragged_array(
+        shapely.GeometryType.POLYGON,
+        np.asarray(coords, dtype=np.float64),
+        (np.asarray(ring_offsets), np.asarray(polygon_offsets)),
+    )
 
-    # If source CRS is already projected (e.g., UTM), area is in the CRS units (meters^2)
-    if is_projected:
-        return polygon.area
 
-    # For geographic CRS, transform to an appropriate UTM zone
-    source_crs = CRS.from_user_input(crs) if crs else CRS.from_epsg(4326)
+def _calculate_areas_m2(polygons: np.ndarray, to_utm: Any) -> np.ndarray:
+    """Calculate polygon areas in square meters.
+
+    Args:
+        polygons: Array of polygon geometries (in the source CRS).
+        to_utm: Transformer from a geographic source CRS to the scene's UTM
+            zone, or None if the source CRS is already projected (area in meters).
 
-    from georisk.geo_utils import get_utm_crs
+    Returns:
+        Array of areas in square meters.
+    """
+    from georisk.geo_utils import transform_geometries
 
-    # Get UTM zone from the polygon centroid (in WGS84)
-    centroid = polygon.centroid
-    utm_crs = get_utm_crs(centroid.x, centroid.y)
+    # If source CRS is already projected (e.g., UTM), area is in the CRS units (meters^2)
+    if to_utm is None or len(polygons) == 0:
+        return shapely.area(polygons)
 
-    # Transform to UTM and calculate area
-    transformer = Transformer.from_crs(source_crs, utm_crs, always_xy=True)
-    utm_polygon = shapely_transform(transformer.transform, polygon)
-    return utm_polygon.area
+    return shapely.area(transform_geometries(polygons, to_utm))
 
 
-def _extract_polygon_stats(
-    polygon: Polygon,
+def _extract_label_stats(
     ndvi_diff: np.ndarray,
-    transform: Any,
-) -> dict[str, float]:
-    """Extract NDVI statistics within a polygon."""
-    from rasterio import features as rio_features
-
-    # Create a mask for the polygon
-    mask = rio_features.geometry_mask(
-        [polygon],
-        out_shape=ndvi_diff.shape,
-        transform=transform,
-        invert=True,
-    )
+    labels: np.ndarray,
+    num_labels: int,
+) -> dict[str, np.ndarray]:
+    """Extract NDVI statistics for every labeled region in one pass each.
+
+    Args:
+        ndvi_diff: NDVI difference array.
+        labels: Integer label image from scipy.ndimage.label (0 = background).
+        num_labels: Number of labels in the image.
+
+    Returns:
+        Dictionary of "mean", "max" and "min" arrays indexed by label - 1.
+        NaN pixels are ignored; regions with no valid pixels get 0.
+    """
+    if num_labels == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return {"mean": empty, "max": empty, "min": empty}
+
+    index = np.arange(1, num_labels + 1)
 
-    # Extract values within polygon
-    values = ndvi_diff[mask]
-    values = values[~np.isnan(values)]
+    # Drop NaN pixels from their region so they don't poison the reductions
+    valid_labels = np.where(np.isnan(ndvi_diff), 0, labels)
+    has_values = np.bincount(valid_labels.ravel(), minlength=num_labels + 1)[1:] > 0
 
-    if len(values) == 0:
-        return {"mean": 0, "max": 0, "min": 0}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stats = {
+            "mean": ndimage.mean(ndvi_diff, valid_labels, index),
+            "max": ndimage.maximum(ndvi_diff, valid_labels, index),
+            "min": ndimage.minimum(ndvi_diff, valid_labels, index),
+        }
 
     return {
-        "mean": float(np.mean(values)),
-        "max": float(np.max(values)),
-        "min": float(np.min(values)),
+        name: np.where(has_values, np.asarray(values, dtype=np.float64), 0.0)
+        for name, values in stats.items()
     }
 
 
@@ -374,3 +404,23 @@ def _classify_change(mean_ndvi_drop: float, land_cover_class: str | None = None)
     elif mean_ndvi_drop > 0.2:
         return "VegetationGain"
     return "Unknown"
+
+
+def _classify_changes(mean_ndvi_drops: np.ndarray) -> np.ndarray:
+    """Classify many changes at once without land cover context.
+
+    Equivalent to calling _classify_change on each value with no land cover
+    class: both loss bands collapse to VegetationLoss, so only the -0.2 and
+    0.2 cut points matter.
+
+    Args:
+        mean_ndvi_drops: Mean NDVI change per polygon (negative = loss).
+
+    Returns:
+        Array of change type strings, one per input value.
+    """
+    return np.select(
+        [mean_ndvi_drops < -0.2, mean_ndvi_drops > 0.2],
+        ["VegetationLoss", "VegetationGain"],
+        default="Unknown",
+    )
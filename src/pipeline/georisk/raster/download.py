@@ -1,7 +1,9 @@
 """Raster download and clipping utilities."""
 
 import json
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -9,14 +11,28 @@ import rasterio
 import rioxarray as rxr
 import structlog
 import xarray as xr
-from pyproj import Transformer
 from rasterio.mask import mask
 from shapely.geometry import box, mapping
 
+from georisk.geo_utils import get_transformer
 from georisk.stac.search import SceneInfo
 
 logger = structlog.get_logger()
 
+# GDAL defaults for remote COG reads: skip directory listings on open, fetch
+# larger blocks and merge adjacent range requests. Existing environment
+# settings take precedence.
+_GDAL_COG_ENV: dict[str, str] = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "CPL_VSIL_CURL_CHUNK_SIZE": "1048576",
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": "67108864",
+}
+for _key, _value in _GDAL_COG_ENV.items():
+    os.environ.setdefault(_key, _value)
+
 
 def _get_wgs84_bounds(da: xr.DataArray) -> tuple[float, float, float, float]:
     """Get WGS84 bounding box from a DataArray in any CRS.
@@ -31,18 +47,12 @@ def _get_wgs84_bounds(da: xr.DataArray) -> tuple[float, float, float, float]:
     crs = da.rio.crs
 
     if crs and crs.to_epsg() != 4326:
-        transformer = Transformer.from_crs(crs, 4326, always_xy=True)
+        transformer = get_transformer(crs, 4326)
         # Transform all four corners to handle non-rectangular projections
-        corners = [
-            (bounds[0], bounds[1]),  # min_x, min_y
-            (bounds[0], bounds[3]),  # min_x, max_y
-            (bounds[2], bounds[1]),  # max_x, min_y
-            (bounds[2], bounds[3]),  # max_x, max_y
-        ]
-        transformed = [transformer.transform(x, y) for x, y in corners]
-        lons = [c[0] for c in transformed]
-        lats = [c[1] for c in transformed]
-        return (min(lons), min(lats), max(lons), max(lats))
+        xs = np.array([bounds[0], bounds[0], bounds[2], bounds[2]])
+        ys = np.array([bounds[1], bounds[3], bounds[1], bounds[3]])
+        lons, lats = transformer.transform(xs, ys)
+        return (float(lons.min()), float(lats.min()), float(lons.max()), float(lats.max()))
 
     return bounds
 
@@ -84,19 +94,16 @@ def create_rgb_composite(
         original_bbox=bbox,
     )
 
-    # Stack into RGB array and convert to float
-    rgb = np.stack([
-        red.values.astype(np.float32),
-        green.values.astype(np.float32),
-        blue.values.astype(np.float32),
-    ])
-
-    # Scale and apply brightness for visualization
-    rgb = rgb * scale_factor * brightness
-
-    # Clip to 0-1 range and convert to uint8 (0-255)
-    rgb = np.clip(rgb, 0, 1) * 255
-    rgb = rgb.astype(np.uint8)
+    # Scale, apply brightness and clip straight into a uint8 (band, y, x)
+    # buffer, reusing one float32 scratch array for the three bands
+    red_values = red.values
+    rgb = np.empty((3, *red_values.shape), dtype=np.uint8)
+    scratch = np.empty(red_values.shape, dtype=np.float32)
+    gain = scale_factor * brightness * 255
+    for band_index, band in enumerate((red_values, green.values, blue.values)):
+        np.multiply(band, gain, out=scratch, dtype=np.float32)
+        np.clip(scratch, 0, 255, out=scratch)
+        rgb[band_index] = scratch
 
     # Get CRS and transform from the source data
     crs = red.rio.crs
@@ -116,6 +123,11 @@ def create_rgb_composite(
         crs=crs,
         transform=transform,
         compress="deflate",
+        predictor=2,
+        tiled=True,
+        blockxsize=512,
+        blockysize=512,
+        num_threads="ALL_CPUS",
     ) as dst:
         dst.write(rgb)
 
@@ -136,7 +148,9 @@ def create_rgb_composite(
         img = Image.fromarray(rgb_hwc, mode='RGB')
 
         png_path = output_path.with_suffix('.png')
-        img.save(png_path, 'PNG', optimize=True)
+        # A fixed moderate zlib level; optimize=True searches encoder settings
+        # and costs far more than it saves for a display image
+        img.save(png_path, 'PNG', compress_level=3)
 
         logger.info(
             "PNG created for web display",
@@ -182,37 +196,64 @@ def download_scene(
         output_dir = Path(tempfile.mkdtemp(prefix="georisk_"))
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    downloaded = {}
-
+    jobs = []
     for band in bands:
         url = scene.get_band_url(band)
         if not url:
             logger.warning("Band not available", band=band, scene_id=scene.scene_id)
             continue
+        jobs.append((band, url, output_dir / f"{scene.scene_id}_{band}.tif"))
 
-        output_path = output_dir / f"{scene.scene_id}_{band}.tif"
+    if not jobs:
+        return {}
 
-        try:
-            logger.info("Downloading band", band=band, scene_id=scene.scene_id)
+    # Each band is an independent COG read; GDAL releases the GIL on I/O
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+        results = executor.map(
+            lambda job: _download_band(scene.scene_id, *job),
+            jobs,
+        )
+        downloaded = {
+            band: path
+            for (band, _, _), path in zip(jobs, results)
+            if path is not None
+        }
 
-            # Use rioxarray to read from remote URL (supports COG range requests)
-            da = rxr.open_rasterio(url)
+    return downloaded
 
-            # Save to local file
-            da.rio.to_raster(output_path)
-            downloaded[band] = output_path
 
-            logger.info(
-                "Band downloaded",
-                band=band,
-                path=str(output_path),
-                shape=da.shape,
-            )
+def _download_band(scene_id: str, band: str, url: str, output_path: Path) -> Path | None:
+    """Download a single band to a local file.
 
-        except Exception as e:
-            logger.error("Failed to download band", band=band, error=str(e))
+    Args:
+        scene_id: Scene identifier (for logging).
+        band: Band name.
+        url: Remote band URL.
+        output_path: Local file path to write.
 
-    return downloaded
+    Returns:
+        The output path, or None if the download failed.
+    """
+    try:
+        logger.info("Downloading band", band=band, scene_id=scene_id)
+
+        # Use rioxarray to read from remote URL (supports COG range requests)
+        da = rxr.open_rasterio(url)
+
+        # Save to local file
+        da.rio.to_raster(output_path)
+
+        logger.info(
+            "Band downloaded",
+            band=band,
+            path=str(output_path),
+            shape=da.shape,
+        )
+        return output_path
+
+    except Exception as e:
+        logger.error("Failed to download band", band=band, error=str(e))
+        return None
 
 
 def clip_to_aoi(
@@ -240,11 +281,10 @@ def clip_to_aoi(
     with rasterio.open(input_path) as src:
         # Convert AOI to raster CRS if needed
         if src.crs and src.crs.to_epsg() != 4326:
-            from pyproj import Transformer
-
-            transformer = Transformer.from_crs(4326, src.crs, always_xy=True)
-            min_x, min_y = transformer.transform(min_lon, min_lat)
-            max_x, max_y = transformer.transform(max_lon, max_lat)
+            transformer = get_transformer(4326, src.crs)
+            (min_x, max_x), (min_y, max_y) = transformer.transform(
+                [min_lon, max_lon], [min_lat, max_lat]
+            )
             aoi_geom = box(min_x, min_y, max_x, max_y)
 
         # Clip the raster
@@ -273,26 +313,29 @@ def load_band(path: Path) -> xr.DataArray:
     Returns:
         DataArray with the raster data.
     """
-    da = rxr.open_rasterio(path)
-    # Squeeze single-band rasters
-    if da.shape[0] == 1:
-        da = da.squeeze("band", drop=True)
-    return da
+    return _squeeze_band(rxr.open_rasterio(path))
 
 
 def load_band_from_url(
     url: str,
     bbox: tuple[float, float, float, float] | None = None,
+    target_grid: xr.DataArray | None = None,
 ) -> xr.DataArray:
     """Load a raster band directly from a URL, optionally clipping to bbox.
 
     Args:
         url: URL to the COG file.
         bbox: Optional bounding box to clip to (in WGS84/EPSG:4326).
+        target_grid: Optional raster whose CRS, transform and shape the band
+            is resampled onto while reading (nearest neighbour, through a
+            WarpedVRT). Takes the place of bbox clipping.
 
     Returns:
         DataArray with the raster data.
     """
+    if target_grid is not None:
+        return _read_onto_grid(url, target_grid)
+
     da = rxr.open_rasterio(url)
 
     # Clip to bbox if provided
@@ -302,10 +345,10 @@ def load_band_from_url(
         # Transform bbox to raster CRS if needed
         raster_crs = da.rio.crs
         if raster_crs and raster_crs.to_epsg() != 4326:
-            from pyproj import Transformer
-            transformer = Transformer.from_crs(4326, raster_crs, always_xy=True)
-            min_x, min_y = transformer.transform(min_lon, min_lat)
-            max_x, max_y = transformer.transform(max_lon, max_lat)
+            transformer = get_transformer(4326, raster_crs)
+            (min_x, max_x), (min_y, max_y) = transformer.transform(
+                [min_lon, max_lon], [min_lat, max_lat]
+            )
         else:
             min_x, min_y, max_x, max_y = min_lon, min_lat, max_lon, max_lat
 
@@ -314,8 +357,38 @@ def load_band_from_url(
         except Exception as e:
             logger.warning(f"Could not clip to bbox: {e}, using full extent")
 
-    # Squeeze single-band rasters
-    if da.shape[0] == 1:
-        da = da.squeeze("band", drop=True)
+    return _squeeze_band(da)
 
+
+def _read_onto_grid(url: str, target_grid: xr.DataArray) -> xr.DataArray:
+    """Read the first band of a raster resampled onto another raster's grid.
+
+    GDAL resamples during the read, so only the source window covering the
+    target grid is fetched and no separate warp pass is needed.
+    """
+    from rasterio.enums import Resampling
+    from rasterio.vrt import WarpedVRT
+
+    height, width = target_grid.shape[-2], target_grid.shape[-1]
+    with rasterio.open(url) as src, WarpedVRT(
+        src,
+        crs=target_grid.rio.crs,
+        transform=target_grid.rio.transform(),
+        width=width,
+        height=height,
+        resampling=Resampling.nearest,
+    ) as vrt:
+        data = vrt.read(1)
+
+    return xr.DataArray(
+        data,
+        dims=target_grid.dims[-2:],
+        coords={dim: target_grid.coords[dim] for dim in target_grid.dims[-2:]},
+    ).rio.write_crs(target_grid.rio.crs)
+
+
+def _squeeze_band(da: xr.DataArray) -> xr.DataArray:
+    """Drop the band dimension of a single-band raster."""
+    if da.sizes.get("band") == 1:
+        return da.squeeze("band", drop=True)
     return da
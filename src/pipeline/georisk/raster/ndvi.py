@@ -87,29 +87,33 @@ def calculate_ndvi(
     else:
         nir = nir_band
 
-    # Convert to float for calculation
-    red_f = red.astype(np.float32)
-    nir_f = nir.astype(np.float32)
-
-    # Calculate NDVI with division-by-zero handling
-    denominator = nir_f + red_f
-    ndvi = xr.where(
-        denominator != 0,
-        (nir_f - red_f) / denominator,
-        nodata_value,
-    )
+    # Calculate NDVI in float32 with in-place ufuncs: one output raster plus
+    # one denominator scratch raster, with division-by-zero handling
+    nir_values = nir.values
+    red_values = red.values
+    ndvi_values = np.subtract(nir_values, red_values, dtype=np.float32)
+    denominator = np.add(nir_values, red_values, dtype=np.float32)
+    nodata_mask = denominator == 0
+    np.divide(ndvi_values, denominator, out=ndvi_values, where=~nodata_mask)
+    ndvi_values[nodata_mask] = nodata_value
+    del denominator
 
     # Clip to valid NDVI range [-1, 1]
-    ndvi = ndvi.clip(-1, 1)
+    np.clip(ndvi_values, -1, 1, out=ndvi_values)
+
+    ndvi = xr.DataArray(ndvi_values, coords=red.coords, dims=red.dims)
 
     # Copy CRS and transform from input
     ndvi = ndvi.rio.write_crs(red.rio.crs)
     if hasattr(red.rio, "transform"):
         ndvi = ndvi.rio.write_transform(red.rio.transform())
 
-    # Calculate statistics (excluding nodata)
-    valid_mask = ndvi != nodata_value
-    valid_data = ndvi.where(valid_mask)
+    # Calculate statistics (excluding nodata) on the valid pixels only,
+    # reusing the zero-denominator mask from the NDVI computation; NaN input
+    # pixels are skipped as well, matching xarray's NaN-skipping reductions
+    valid_values = ndvi_values[~nodata_mask & np.isfinite(ndvi_values)]
+    has_valid = valid_values.size > 0
+    del nodata_mask
 
     result = NdviResult(
         data=ndvi,
@@ -117,9 +121,9 @@ def calculate_ndvi(
         datetime=datetime_str,
         crs=red.rio.crs,
         transform=red.rio.transform() if hasattr(red.rio, "transform") else None,
-        min_value=float(valid_data.min().values) if valid_mask.any() else -1,
-        max_value=float(valid_data.max().values) if valid_mask.any() else 1,
-        mean_value=float(valid_data.mean().values) if valid_mask.any() else 0,
+        min_value=float(valid_values.min()) if has_valid else -1,
+        max_value=float(valid_values.max()) if has_valid else 1,
+        mean_value=float(valid_values.mean(dtype=np.float64)) if has_valid else 0,
     )
 
     logger.info(
@@ -2,6 +2,7 @@
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,16 +12,21 @@ import structlog
 import xarray as xr
 from pyproj import CRS, Transformer
 from rasterio import features as rio_features
+from rasterio import windows as rio_windows
 from scipy import ndimage
 from shapely.geometry import Point, Polygon
 from shapely.ops import transform as shapely_transform
 
 from georisk.config import get_config
+from georisk.geo_utils import get_transformer, get_utm_transformer
 
 logger = structlog.get_logger()
 
+# Rows of elevation processed per slope/aspect block
+_SLOPE_BLOCK_ROWS = 1024
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TerrainData:
     """Terrain analysis results for a location/polygon."""
 
@@ -29,7 +35,7 @@ class TerrainData:
     elevation_m: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DirectionalTerrainMetrics:
     """Terrain relationship between change and asset."""
 
@@ -40,7 +46,7 @@ class DirectionalTerrainMetrics:
     slope_toward_asset_deg: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DEMData:
     """Container for DEM data with derived products."""
 
@@ -112,6 +118,25 @@ def _resolution_to_meters(
     return avg_res
 
 
+@lru_cache(maxsize=1)
+def _planetary_computer_catalog() -> Any:
+    """Open the Planetary Computer STAC catalog once per process.
+
+    Items are signed as they are fetched (planetary_computer refreshes
+    expired tokens), so the client can be shared across searches.
+
+    Returns:
+        pystac_client.Client with the signing modifier.
+    """
+    import planetary_computer
+    import pystac_client
+
+    return pystac_client.Client.open(
+        "https://planetarycomputer.microsoft.com/api/stac/v1",
+        modifier=planetary_computer.sign_inplace,
+    )
+
+
 def _load_3dep_dem(
     bbox: tuple[float, float, float, float],
     cache_dir: Path | None = None,
@@ -126,13 +151,7 @@ def _load_3dep_dem(
         DEMData or None if not available.
     """
     try:
-        import planetary_computer
-        import pystac_client
-
-        catalog = pystac_client.Client.open(
-            "https://planetarycomputer.microsoft.com/api/stac/v1",
-            modifier=planetary_computer.sign_inplace,
-        )
+        catalog = _planetary_computer_catalog()
 
         # Search for 3DEP DEM tiles
         search = catalog.search(
@@ -162,12 +181,13 @@ def _load_3dep_dem(
         # Load and clip to bbox
         logger.info("Loading DEM from URL", url=signed_url[:100] + "...")
 
-        da = rxr.open_rasterio(signed_url)
+        # Open lazily without caching so nothing outside the bbox is read
+        da = rxr.open_rasterio(signed_url, cache=False)
 
         # Transform bbox to DEM CRS for clipping
         dem_crs = da.rio.crs
         if dem_crs and dem_crs.to_epsg() != 4326:
-            transformer = Transformer.from_crs(4326, dem_crs, always_xy=True)
+            transformer = get_transformer(4326, dem_crs)
             min_x, min_y = transformer.transform(bbox[0], bbox[1])
             max_x, max_y = transformer.transform(bbox[2], bbox[3])
         else:
@@ -183,6 +203,9 @@ def _load_3dep_dem(
         if da.ndim == 3 and da.shape[0] == 1:
             da = da.squeeze("band", drop=True)
 
+        # Fetch the clipped window from the COG in one read
+        da = da.load()
+
         # Calculate resolution in meters (convert from degrees if geographic CRS)
         res_x = abs(float(da.rio.resolution()[0]))
         res_y = abs(float(da.rio.resolution()[1]))
@@ -306,12 +329,13 @@ def _load_local_dem(dem_path: Path, bbox: tuple[float, float, float, float]) ->
         return None
 
     try:
-        da = rxr.open_rasterio(dem_path)
+        # Open lazily without caching so nothing outside the bbox is read
+        da = rxr.open_rasterio(dem_path, cache=False)
 
         # Transform bbox to DEM CRS for clipping
         dem_crs = da.rio.crs
         if dem_crs and dem_crs.to_epsg() != 4326:
-            transformer = Transformer.from_crs(4326, dem_crs, always_xy=True)
+            transformer = get_transformer(4326, dem_crs)
             min_x, min_y = transformer.transform(bbox[0], bbox[1])
             max_x, max_y = transformer.transform(bbox[2], bbox[3])
         else:
@@ -323,6 +347,9 @@ def _load_local_dem(dem_path: Path, bbox: tuple[float, float, float, float]) ->
         if da.ndim == 3 and da.shape[0] == 1:
             da = da.squeeze("band", drop=True)
 
+        # Read the clipped window once
+        da = da.load()
+
         res_x = abs(float(da.rio.resolution()[0]))
         res_y = abs(float(da.rio.resolution()[1]))
         center_lat = (bbox[1] + bbox[3]) / 2
@@ -343,7 +370,9 @@ def _load_local_dem(dem_path: Path, bbox: tuple[float, float, float, float]) ->
 def calculate_slope_aspect(dem: DEMData) -> DEMData:
     """Calculate slope and aspect rasters from DEM elevation.
 
-    Uses the Horn (1981) algorithm for slope and aspect calculation.
+    Uses the Horn (1981) algorithm for slope and aspect calculation. The
+    raster is processed in row blocks with a one-row halo, so temporaries
+    stay block-sized regardless of DEM size.
 
     Args:
         dem: DEMData with elevation raster.
@@ -353,43 +382,24 @@ def calculate_slope_aspect(dem: DEMData) -> DEMData:
     """
     logger.info("Calculating slope and aspect")
 
-    elev = dem.elevation.values.astype(np.float64)
-
-    # Handle NaN values
-    nodata_mask = np.isnan(elev)
-    if nodata_mask.any():
-        elev = np.where(nodata_mask, 0, elev)
-
-    # Cell size in meters (converted from degrees by _resolution_to_meters if needed)
-    cell_size = dem.resolution_m
+    elev = dem.elevation.values
+    height = elev.shape[0]
 
-    # Calculate gradients using Sobel-like filters (Horn algorithm)
-    # dz/dx kernel: [[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]] / (8 * cell_size)
-    # dz/dy kernel: [[1, 2, 1], [0, 0, 0], [-1, -2, -1]] / (8 * cell_size)
+    slope_deg = np.empty(elev.shape, dtype=np.float32)
+    aspect_deg = np.empty(elev.shape, dtype=np.float32)
 
-    kernel_x = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]]) / (8 * cell_size)
-    kernel_y = np.array([[1, 2, 1], [0, 0, 0], [-1, -2, -1]]) / (8 * cell_size)
-
-    dz_dx = ndimage.convolve(elev, kernel_x, mode="nearest")
-    dz_dy = ndimage.convolve(elev, kernel_y, mode="nearest")
-
-    # Calculate slope in degrees
-    slope_rad = np.arctan(np.sqrt(dz_dx**2 + dz_dy**2))
-    slope_deg = np.degrees(slope_rad)
-
-    # Calculate aspect in degrees (0=N, 90=E, 180=S, 270=W)
-    aspect_rad = np.arctan2(-dz_dx, dz_dy)  # Note the negation for proper orientation
-    aspect_deg = np.degrees(aspect_rad)
-    aspect_deg = np.where(aspect_deg < 0, aspect_deg + 360, aspect_deg)
-
-    # Restore NaN values
-    if nodata_mask.any():
-        slope_deg = np.where(nodata_mask, np.nan, slope_deg)
-        aspect_deg = np.where(nodata_mask, np.nan, aspect_deg)
+    for start in range(0, height, _SLOPE_BLOCK_ROWS):
+        stop = min(start + _SLOPE_BLOCK_ROWS, height)
+        # Include one neighbouring row on each side for the 3x3 stencil
+        lo = max(start - 1, 0)
+        hi = min(stop + 1, height)
+        block_slope, block_aspect = _horn_slope_aspect(elev[lo:hi], dem.resolution_m)
+        slope_deg[start:stop] = block_slope[start - lo:stop - lo]
+        aspect_deg[start:stop] = block_aspect[start - lo:stop - lo]
 
     # Create DataArrays with same coordinates as elevation
-    slope_da = dem.elevation.copy(data=slope_deg.astype(np.float32))
-    aspect_da = dem.elevation.copy(data=aspect_deg.astype(np.float32))
+    slope_da = dem.elevation.copy(data=slope_deg)
+    aspect_da = dem.elevation.copy(data=aspect_deg)
 
     logger.info(
         "Slope/aspect calculated",
@@ -408,51 +418,152 @@ def calculate_slope_aspect(dem: DEMData) -> DEMData:
     )
 
 
+def _horn_slope_aspect(elev: np.ndarray, cell_size: float) -> tuple[np.ndarray, np.ndarray]:
+    """Apply the Horn (1981) slope/aspect kernels to an elevation array.
+
+    Edges are handled by repeating the nearest cell.
+
+    Args:
+        elev: 2D elevation array (NaN = nodata).
+        cell_size: Cell size in meters.
+
+    Returns:
+        Tuple of (slope, aspect) float32 arrays in degrees, NaN where the
+        elevation is NaN. Aspect is clockwise from north (0=N, 90=E).
+    """
+    # float32 resolves millimetres at DEM elevations; astype copies, so the
+    # nodata fill below does not touch the caller's array
+    elev = elev.astype(np.float32)
+
+    # Handle NaN values
+    nodata_mask = np.isnan(elev)
+    has_nodata = nodata_mask.any()
+    if has_nodata:
+        elev[nodata_mask] = 0
+
+    # Calculate gradients using Sobel-like filters (Horn algorithm)
+    # dz/dx kernel: [[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]] / (8 * cell_size)
+    # dz/dy kernel: [[1, 2, 1], [0, 0, 0], [-1, -2, -1]] / (8 * cell_size)
+    # Both are outer products of [1, 2, 1] smoothing and [1, 0, -1]
+    # differencing, so each is applied as two 1D passes.
+    scale = np.float32(1.0 / (8 * cell_size))
+
+    dz_dx = ndimage.convolve1d(elev, [1, 2, 1], axis=0, mode="nearest")
+    dz_dx = ndimage.convolve1d(dz_dx, [-1, 0, 1], axis=1, mode="nearest")
+    dz_dx *= scale
+
+    dz_dy = ndimage.convolve1d(elev, [1, 0, -1], axis=0, mode="nearest")
+    dz_dy = ndimage.convolve1d(dz_dy, [1, 2, 1], axis=1, mode="nearest")
+    dz_dy *= scale
+
+    # Calculate aspect in degrees (0=N, 90=E, 180=S, 270=W);
+    # -arctan2(dx, dy) equals arctan2(-dx, dy) for proper orientation
+    aspect_deg = np.arctan2(dz_dx, dz_dy)
+    np.negative(aspect_deg, out=aspect_deg)
+    np.degrees(aspect_deg, out=aspect_deg)
+    np.add(aspect_deg, 360, out=aspect_deg, where=aspect_deg < 0)
+
+    # Calculate slope in degrees, reusing the dz/dx buffer
+    slope_deg = np.hypot(dz_dx, dz_dy, out=dz_dx)
+    np.arctan(slope_deg, out=slope_deg)
+    np.degrees(slope_deg, out=slope_deg)
+
+    # Restore NaN values
+    if has_nodata:
+        slope_deg[nodata_mask] = np.nan
+        aspect_deg[nodata_mask] = np.nan
+
+    return slope_deg, aspect_deg
+
+
 def sample_terrain_at_point(dem: DEMData, point: Point) -> TerrainData | None:
     """Sample terrain data at a specific point.
 
+    For many points, use sample_terrain_at_points() to do one vectorized
+    lookup.
+
     Args:
         dem: DEMData with elevation (and optionally slope/aspect).
         point: Point geometry in WGS84.
 
     Returns:
-        TerrainData or None if point is outside DEM bounds.
+        TerrainData or None if the DEM has no elevation at the point.
     """
-    # Transform point to DEM CRS if needed
-    if dem.crs and CRS.from_user_input(dem.crs).to_epsg() != 4326:
-        transformer = Transformer.from_crs(4326, dem.crs, always_xy=True)
-        x, y = transformer.transform(point.x, point.y)
-    else:
-        x, y = point.x, point.y
+    return sample_terrain_at_points(dem, [point.x], [point.y])[0]
 
-    try:
-        # Sample elevation
-        elev = float(dem.elevation.sel(x=x, y=y, method="nearest").values)
 
-        # Sample slope if available
-        if dem.slope is not None:
-            slope = float(dem.slope.sel(x=x, y=y, method="nearest").values)
-        else:
-            slope = 0.0
+def sample_terrain_at_points(
+    dem: DEMData,
+    xs: Any,
+    ys: Any,
+) -> list[TerrainData | None]:
+    """Sample terrain data at many points with one vectorized lookup.
 
-        # Sample aspect if available
-        if dem.aspect is not None:
-            aspect = float(dem.aspect.sel(x=x, y=y, method="nearest").values)
-        else:
-            aspect = 0.0
+    Points are reprojected in a single transformer call, mapped to DEM
+    pixels with the inverse affine transform (clamped to the raster like a
+    nearest-coordinate selection), and gathered with NumPy fancy indexing.
 
-        if np.isnan(elev):
-            return None
+    Args:
+        dem: DEMData with elevation (and optionally slope/aspect).
+        xs: Point longitudes in WGS84 (sequence or array).
+        ys: Point latitudes in WGS84 (sequence or array).
+
+    Returns:
+        One TerrainData per point, in input order, with None where the
+        point is undefined or the DEM has no elevation.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    if xs.size == 0:
+        return []
+
+    # Transform points to DEM CRS if needed
+    if dem.crs and CRS.from_user_input(dem.crs).to_epsg() != 4326:
+        transformer = get_transformer(4326, dem.crs)
+        xs, ys = transformer.transform(xs, ys)
+
+    elev_array = _band_array(dem.elevation)
+    h, w = elev_array.shape
+    dem_transform = dem.transform if dem.transform is not None else dem.elevation.rio.transform()
+    cols, rows = ~dem_transform * (np.asarray(xs), np.asarray(ys))
 
-        return TerrainData(
-            slope_degrees=slope if not np.isnan(slope) else 0.0,
-            aspect_degrees=aspect if not np.isnan(aspect) else 0.0,
+    valid = np.isfinite(rows) & np.isfinite(cols)
+    rows = np.clip(np.floor(np.where(valid, rows, 0)), 0, h - 1).astype(np.intp)
+    cols = np.clip(np.floor(np.where(valid, cols, 0)), 0, w - 1).astype(np.intp)
+
+    # Sample elevation, slope and aspect (0.0 where unavailable)
+    elevs = np.where(valid, elev_array[rows, cols], np.nan)
+    if dem.slope is not None:
+        slopes = np.nan_to_num(_band_array(dem.slope)[rows, cols], nan=0.0)
+    else:
+        slopes = np.zeros(len(rows))
+    if dem.aspect is not None:
+        aspects = np.nan_to_num(_band_array(dem.aspect)[rows, cols], nan=0.0)
+    else:
+        aspects = np.zeros(len(rows))
+
+    return [
+        None if math.isnan(elev) else TerrainData(
+            slope_degrees=slope,
+            aspect_degrees=aspect,
             elevation_m=elev,
         )
+        for elev, slope, aspect in zip(elevs.tolist(), slopes.tolist(), aspects.tolist())
+    ]
 
-    except (KeyError, IndexError):
-        logger.debug("Point outside DEM bounds", x=x, y=y)
-        return None
+
+def _band_array(data: xr.DataArray) -> np.ndarray:
+    """Return the 2D values of a single-band raster, dropping a band axis."""
+    values = data.values
+    if values.ndim == 3:
+        values = values[0]
+    return values
+
+
+def _masked_values(array: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Gather the non-NaN values of a 2D array at flat pixel indices."""
+    values = array.ravel()[indices]
+    return values[~np.isnan(values)]
 
 
 def extract_terrain_stats_for_polygon(
@@ -479,21 +590,32 @@ def extract_terrain_stats_for_polygon(
     dem_crs = CRS.from_user_input(dem.crs) if dem.crs else CRS.from_epsg(4326)
 
     if polygon_crs != dem_crs:
-        transformer = Transformer.from_crs(polygon_crs, dem_crs, always_xy=True)
+        transformer = get_transformer(polygon_crs, dem_crs)
         polygon = shapely_transform(transformer.transform, polygon)
 
-    # Create mask for the polygon
-    elev_array = dem.elevation.values
-    if elev_array.ndim == 3:
-        elev_array = elev_array[0]
+    # Create mask for the polygon over its bounding-box window only
+    elev_array = _band_array(dem.elevation)
+    height, width = elev_array.shape
 
     try:
-        mask = rio_features.geometry_mask(
-            [polygon],
-            out_shape=elev_array.shape,
-            transform=dem.transform,
-            invert=True,
-        )
+        bbox_window = rio_windows.from_bounds(*polygon.bounds, transform=dem.transform)
+        row_off = max(math.floor(bbox_window.row_off), 0)
+        col_off = max(math.floor(bbox_window.col_off), 0)
+        row_stop = min(math.ceil(bbox_window.row_off + bbox_window.height), height)
+        col_stop = min(math.ceil(bbox_window.col_off + bbox_window.width), width)
+
+        if row_stop > row_off and col_stop > col_off:
+            window = rio_windows.Window(
+                col_off, row_off, col_stop - col_off, row_stop - row_off
+            )
+            mask = rio_features.geometry_mask(
+                [polygon],
+                out_shape=(window.height, window.width),
+                transform=rio_windows.transform(window, dem.transform),
+                invert=True,
+            )
+        else:
+            mask = np.zeros((0, 0), dtype=bool)
     except Exception as e:
         logger.warning("Could not create polygon mask", error=str(e))
         return {
@@ -503,20 +625,22 @@ def extract_terrain_stats_for_polygon(
             "aspect_degrees": 0.0,
         }
 
+    # Flat pixel indices inside the polygon (in full-raster terms), shared by every band
+    mask_rows, mask_cols = np.nonzero(mask)
+    if mask_rows.size:
+        indices = (mask_rows + row_off) * width + (mask_cols + col_off)
+    else:
+        indices = np.empty(0, dtype=np.intp)
+
     # Extract statistics
-    elev_values = elev_array[mask]
-    elev_values = elev_values[~np.isnan(elev_values)]
+    elev_values = _masked_values(elev_array, indices)
 
     stats = {
         "elevation_m": float(np.mean(elev_values)) if len(elev_values) > 0 else 0.0,
     }
 
     if dem.slope is not None:
-        slope_array = dem.slope.values
-        if slope_array.ndim == 3:
-            slope_array = slope_array[0]
-        slope_values = slope_array[mask]
-        slope_values = slope_values[~np.isnan(slope_values)]
+        slope_values = _masked_values(_band_array(dem.slope), indices)
 
         stats["slope_degree_mean"] = (
             float(np.mean(slope_values)) if len(slope_values) > 0 else 0.0
@@ -526,17 +650,14 @@ def extract_terrain_stats_for_polygon(
         )
 
     if dem.aspect is not None:
-        aspect_array = dem.aspect.values
-        if aspect_array.ndim == 3:
-            aspect_array = aspect_array[0]
-        aspect_values = aspect_array[mask]
-        aspect_values = aspect_values[~np.isnan(aspect_values)]
+        aspect_values = _masked_values(_band_array(dem.aspect), indices)
 
         # Calculate mean aspect using circular mean
         if len(aspect_values) > 0:
-            aspect_rad = np.radians(aspect_values)
-            mean_sin = np.mean(np.sin(aspect_rad))
-            mean_cos = np.mean(np.cos(aspect_rad))
+            aspect_rad = np.radians(aspect_values, out=aspect_values)
+            trig = np.sin(aspect_rad)
+            mean_sin = np.mean(trig)
+            mean_cos = np.mean(np.cos(aspect_rad, out=trig))
             mean_aspect = np.degrees(np.arctan2(mean_sin, mean_cos))
             stats["aspect_degrees"] = float(mean_aspect % 360)
         else:
@@ -549,6 +670,9 @@ def calculate_directional_metrics(
     dem: DEMData,
     change_centroid: Point,
     asset_location: Point,
+    change_terrain: TerrainData | None = None,
+    asset_terrain: TerrainData | None = None,
+    transformer: Transformer | None = None,
 ) -> DirectionalTerrainMetrics | None:
     """Calculate directional terrain relationship between change and asset.
 
@@ -556,13 +680,21 @@ def calculate_directional_metrics(
         dem: DEMData with elevation.
         change_centroid: Centroid of change polygon (WGS84).
         asset_location: Asset location point (WGS84).
+        change_terrain: Terrain already sampled at change_centroid. Sampled
+            from dem if None.
+        asset_terrain: Terrain already sampled at asset_location. Sampled
+            from dem if None.
+        transformer: WGS84 -> metric CRS transformer for the slope distance.
+            A UTM transformer for the midpoint is used if None.
 
     Returns:
         DirectionalTerrainMetrics or None if elevations can't be sampled.
     """
-    # Sample elevations at both points
-    change_terrain = sample_terrain_at_point(dem, change_centroid)
-    asset_terrain = sample_terrain_at_point(dem, asset_location)
+    # Sample elevations at both points unless provided
+    if change_terrain is None:
+        change_terrain = sample_terrain_at_point(dem, change_centroid)
+    if asset_terrain is None:
+        asset_terrain = sample_terrain_at_point(dem, asset_location)
 
     if change_terrain is None or asset_terrain is None:
         return None
@@ -577,7 +709,7 @@ def calculate_directional_metrics(
 
     # Calculate slope angle toward asset
     slope_toward = _calculate_slope_toward_point(
-        dem, change_centroid, asset_location, change_elev, asset_elev
+        dem, change_centroid, asset_location, change_elev, asset_elev, transformer
     )
 
     return DirectionalTerrainMetrics(
@@ -595,6 +727,7 @@ def _calculate_slope_toward_point(
     to_point: Point,
     from_elev: float,
     to_elev: float,
+    transformer: Transformer | None = None,
 ) -> float:
     """Calculate slope angle from one point toward another.
 
@@ -604,22 +737,27 @@ def _calculate_slope_toward_point(
         to_point: Target point (WGS84).
         from_elev: Elevation at from_point.
         to_elev: Elevation at to_point.
+        transformer: WGS84 -> metric CRS transformer. A UTM transformer for
+            the midpoint is used if None.
 
     Returns:
         Slope angle in degrees. Positive = downhill toward target.
     """
-    # Transform to projected CRS for accurate distance
-    centroid = Point((from_point.x + to_point.x) / 2, (from_point.y + to_point.y) / 2)
-
-    from georisk.geo_utils import get_utm_transformer
+    # Points within ~0.1 m of each other are below the 1 m distance floor
+    if abs(from_point.x - to_point.x) < 1e-6 and abs(from_point.y - to_point.y) < 1e-6:
+        return 0.0
 
-    transformer = get_utm_transformer(centroid.x, centroid.y)
+    # Transform to projected CRS for accurate distance
+    if transformer is None:
+        centroid = Point((from_point.x + to_point.x) / 2, (from_point.y + to_point.y) / 2)
+        transformer = get_utm_transformer(centroid.x, centroid.y)
 
-    from_x, from_y = transformer.transform(from_point.x, from_point.y)
-    to_x, to_y = transformer.transform(to_point.x, to_point.y)
+    (from_x, to_x), (from_y, to_y) = transformer.transform(
+        (from_point.x, to_point.x), (from_point.y, to_point.y)
+    )
 
     # Horizontal distance
-    dist_m = math.sqrt((to_x - from_x) ** 2 + (to_y - from_y) ** 2)
+    dist_m = math.hypot(to_x - from_x, to_y - from_y)
 
     if dist_m < 1.0:  # Avoid division by zero
         return 0.0
@@ -1,12 +1,28 @@
 """Asset proximity analysis for risk assessment."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import shapely
 import structlog
-from pyproj import CRS, Transformer
+from pyproj import Transformer
 from shapely.geometry import Polygon, shape
-from shapely.ops import transform
+
+from georisk.geo_utils import get_utm_transformer, transform_geometries
+
+if TYPE_CHECKING:
+    from georisk.raster.terrain import DirectionalTerrainMetrics, TerrainData
+
+try:
+    from georisk.raster.terrain import (
+        calculate_directional_metrics,
+        sample_terrain_at_points,
+    )
+except ImportError:  # terrain dependencies (rasterio, scipy) not installed
+    calculate_directional_metrics = None  # type: ignore[assignment]
+    sample_terrain_at_points = None  # type: ignore[assignment]
 
 logger = structlog.get_logger()
 
@@ -15,7 +31,7 @@ logger = structlog.get_logger()
 OVERHEAD_LINE_TYPES = {'TransmissionLine'}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProximityResult:
     """Result of proximity analysis between change polygon and asset."""
 
@@ -34,12 +50,97 @@ class ProximityResult:
     slope_toward_asset_deg: float | None = None
 
 
+@dataclass
+class PreparedAssets:
+    """Assets parsed, filtered and projected once for repeated proximity queries."""
+
+    assets: list[dict[str, Any]]  # Asset dicts that passed validation
+    geometries: list[Any]         # WGS84 shapely geometries, aligned with assets
+    projected: np.ndarray         # Geometries in the metric CRS (object array)
+    to_projected: Any             # WGS84 -> metric Transformer, or None if unprojected
+    tree: shapely.STRtree         # Spatial index over projected geometries
+
+
+def prepare_assets(
+    assets: list[dict[str, Any]],
+    to_projected: Transformer | None,
+) -> PreparedAssets:
+    """Parse, filter and project assets and build a spatial index over them.
+
+    Overhead lines and assets with non-WGS84 coordinates are dropped, as in
+    find_nearby_assets().
+
+    Args:
+        assets: List of asset dictionaries from the API.
+        to_projected: Transformer from WGS84 to a metric CRS, or None to keep
+            geometries as they are.
+
+    Returns:
+        PreparedAssets with an STRtree over the projected geometries.
+    """
+    kept_assets = []
+    geometries = []
+
+    for asset in assets:
+        try:
+            # Parse asset geometry
+            asset_geom = asset.get("geometry")
+            if not asset_geom:
+                continue
+
+            if isinstance(asset_geom, dict):
+                asset_geom = shape(asset_geom)
+
+            # Skip overhead line geometries — ground changes don't affect suspended cables
+            if (asset_geom.geom_type in ('LineString', 'MultiLineString') and
+                    asset.get('assetTypeName') in OVERHEAD_LINE_TYPES):
+                logger.debug(
+                    "Skipping overhead line geometry",
+                    asset_name=asset.get("name"),
+                    asset_type=asset.get("assetTypeName"),
+                )
+                continue
+
+            # Validate asset coordinates are in WGS84 range
+            asset_bounds = asset_geom.bounds  # (minx, miny, maxx, maxy)
+            if (asset_bounds[0] < -180 or asset_bounds[2] > 180 or
+                    asset_bounds[1] < -90 or asset_bounds[3] > 90):
+                logger.warning(
+                    "Skipping asset with non-WGS84 coordinates",
+                    asset_id=asset.get("assetId"),
+                    asset_name=asset.get("name"),
+                    bounds=asset_bounds,
+                )
+                continue
+
+        except Exception as e:
+            logger.warning("Failed to process asset", asset_id=asset.get("assetId"), error=str(e))
+            continue
+
+        kept_assets.append(asset)
+        geometries.append(asset_geom)
+
+    # Transform all assets to projected CRS in one call if we have a transformer
+    projected_array = np.array(geometries, dtype=object)
+    if to_projected:
+        projected_array = transform_geometries(projected_array, to_projected)
+    return PreparedAssets(
+        assets=kept_assets,
+        geometries=geometries,
+        projected=projected_array,
+        to_projected=to_projected,
+        tree=shapely.STRtree(projected_array),
+    )
+
+
 def find_nearby_assets(
     change_polygon: Polygon,
     assets: list[dict[str, Any]],
     max_distance_m: float = 2500.0,
     dem_data: Any = None,
     change_elevation_m: float | None = None,
+    prepared_assets: "PreparedAssets | None" = None,
+    change_terrain: Any = None,
 ) -> list[ProximityResult]:
     """Find assets within a specified distance of a change polygon.
 
@@ -49,6 +150,11 @@ def find_nearby_assets(
         max_distance_m: Maximum distance in meters to search.
         dem_data: Optional DEMData object for terrain analysis.
         change_elevation_m: Optional pre-calculated elevation at change centroid.
+        prepared_assets: Assets already parsed, projected and indexed by
+            prepare_assets(). Its projection is reused for the change
+            polygon; if None, the assets are prepared for this call.
+        change_terrain: TerrainData already sampled at the change centroid.
+            Sampled from dem_data if None.
 
     Returns:
         List of ProximityResult objects for nearby assets.
@@ -71,127 +177,99 @@ def find_nearby_assets(
         )
         # Assume it's already in a projected CRS with meters
         # This is a fallback - ideally polygons should be transformed to WGS84 before this
+        if prepared_assets is None or prepared_assets.to_projected is not None:
+            prepared_assets = prepare_assets(assets, None)
         change_projected = change_polygon
-        to_projected = None
     else:
-        from georisk.geo_utils import get_utm_crs
-
-        # Calculate UTM zone from WGS84 coordinates
-        utm_crs = get_utm_crs(centroid.x, centroid.y)
-        wgs84_crs = CRS.from_epsg(4326)
-
-        # Create transformer from WGS84 to UTM
-        to_projected = Transformer.from_crs(wgs84_crs, utm_crs, always_xy=True)
+        if prepared_assets is None or prepared_assets.to_projected is None:
+            # Transformer from WGS84 to the UTM zone of the change centroid
+            to_projected = get_utm_transformer(centroid.x, centroid.y)
+            prepared_assets = prepare_assets(assets, to_projected)
 
         # Transform change polygon to UTM for accurate distance calculation
-        change_projected = transform(to_projected.transform, change_polygon)
+        change_projected = transform_geometries(
+            np.array([change_polygon], dtype=object), prepared_assets.to_projected
+        )[0]
 
     # Import terrain module if DEM data is provided
-    terrain_module = None
-    if dem_data is not None:
-        try:
-            from georisk.raster.terrain import (  # noqa: F811
-                calculate_directional_metrics,
-            )
-            terrain_module = True
-        except ImportError:
-            logger.warning(
-                "Terrain module not available for directional analysis"
-            )
-            terrain_module = None
+    if dem_data is not None and calculate_directional_metrics is None:
+        logger.warning(
+            "Terrain module not available for directional analysis"
+        )
 
-    for asset in assets:
+    # Query the spatial index with the change bounds grown by the search
+    # radius, then compute exact distances for the candidates only
+    minx, miny, maxx, maxy = change_projected.bounds
+    candidates = prepared_assets.tree.query(shapely.box(
+        minx - max_distance_m, miny - max_distance_m,
+        maxx + max_distance_m, maxy + max_distance_m,
+    ))
+
+    # Calculate distances in meters in one vectorized GEOS call
+    candidates = np.sort(candidates)
+    distances = shapely.distance(prepared_assets.projected[candidates], change_projected)
+    within = np.flatnonzero(distances <= max_distance_m)
+
+    # Order matches by distance (stable, so ties keep asset order)
+    within = within[np.argsort(distances[within], kind="stable")]
+
+    matches = [
+        (prepared_assets.assets[idx], prepared_assets.geometries[idx], distance_m)
+        for idx, distance_m in zip(candidates[within].tolist(), distances[within].tolist())
+    ]
+
+    # Calculate terrain metrics if DEM is available, sampling every nearby
+    # asset location (and the change centroid unless given) in one DEM lookup
+    metrics_list: list["DirectionalTerrainMetrics | None"] = [None] * len(matches)
+    if dem_data is not None and calculate_directional_metrics is not None and matches:
         try:
-            # Parse asset geometry
-            asset_geom = asset.get("geometry")
-            if not asset_geom:
-                continue
-
-            if isinstance(asset_geom, dict):
-                asset_geom = shape(asset_geom)
-
-            # Skip overhead line geometries — ground changes don't affect suspended cables
-            if (asset_geom.geom_type in ('LineString', 'MultiLineString') and
-                    asset.get('assetTypeName') in OVERHEAD_LINE_TYPES):
-                logger.debug(
-                    "Skipping overhead line geometry",
-                    asset_name=asset.get("name"),
-                    asset_type=asset.get("assetTypeName"),
-                )
-                continue
-
-            # Validate asset coordinates are in WGS84 range
-            asset_bounds = asset_geom.bounds  # (minx, miny, maxx, maxy)
-            if (asset_bounds[0] < -180 or asset_bounds[2] > 180 or
-                    asset_bounds[1] < -90 or asset_bounds[3] > 90):
-                logger.warning(
-                    "Skipping asset with non-WGS84 coordinates",
-                    asset_id=asset.get("assetId"),
-                    asset_name=asset.get("name"),
-                    bounds=asset_bounds,
+            # Get asset centroids for point-based terrain sampling
+            asset_points = shapely.centroid(
+                np.array([asset_geom for _, asset_geom, _ in matches], dtype=object)
+            )
+            xs = shapely.get_x(asset_points)
+            ys = shapely.get_y(asset_points)
+            if change_terrain is None:
+                terrains = sample_terrain_at_points(
+                    dem_data,
+                    np.concatenate(([centroid.x], xs)),
+                    np.concatenate(([centroid.y], ys)),
                 )
-                continue
-
-            # Transform to projected CRS if we have a transformer
-            if to_projected:
-                asset_projected = transform(to_projected.transform, asset_geom)
+                change_terrain = terrains[0]
+                asset_terrains = terrains[1:]
             else:
-                asset_projected = asset_geom
-
-            # Calculate distance in meters
-            distance_m = change_projected.distance(asset_projected)
-
-            if distance_m <= max_distance_m:
-                # Calculate terrain metrics if DEM is available
-                asset_elevation_m = None
-                elevation_diff_m = None
-                is_upslope = None
-                slope_toward_asset_deg = None
-
-                if terrain_module and dem_data is not None:
-                    from shapely.geometry import Point
-
-                    from georisk.raster.terrain import (
-                        calculate_directional_metrics,
+                asset_terrains = sample_terrain_at_points(dem_data, xs, ys)
+            if change_terrain is not None:
+                metrics_list = [
+                    calculate_directional_metrics(
+                        dem_data,
+                        centroid,
+                        asset_point,
+                        change_terrain=change_terrain,
+                        asset_terrain=asset_terrain,
+                        transformer=prepared_assets.to_projected,
                     )
-
-                    # Get asset centroid for point-based terrain sampling
-                    asset_point = (
-                        asset_geom.centroid
-                        if hasattr(asset_geom, 'centroid')
-                        else Point(asset_geom.coords[0])
-                    )
-                    change_point = centroid
-
-                    # Calculate directional metrics
-                    metrics = calculate_directional_metrics(dem_data, change_point, asset_point)
-                    if metrics is not None:
-                        asset_elevation_m = metrics.asset_elevation_m
-                        elevation_diff_m = metrics.elevation_diff_m
-                        is_upslope = metrics.is_upslope
-                        slope_toward_asset_deg = metrics.slope_toward_asset_deg
-
-                results.append(ProximityResult(
-                    asset_id=asset.get("assetId", "unknown"),
-                    asset_name=asset.get("name", "Unknown"),
-                    asset_type=asset.get("assetType", 0),
-                    asset_type_name=asset.get("assetTypeName", "Unknown"),
-                    criticality=asset.get("criticality", 1),
-                    criticality_name=asset.get("criticalityName", "Medium"),
-                    distance_meters=distance_m,
-                    asset_geometry=asset_geom,
-                    asset_elevation_m=asset_elevation_m,
-                    elevation_diff_m=elevation_diff_m,
-                    is_upslope=is_upslope,
-                    slope_toward_asset_deg=slope_toward_asset_deg,
-                ))
-
+                    if asset_terrain is not None else None
+                    for asset_point, asset_terrain in zip(asset_points, asset_terrains)
+                ]
         except Exception as e:
-            logger.warning("Failed to process asset", asset_id=asset.get("assetId"), error=str(e))
-            continue
-
-    # Sort by distance
-    results.sort(key=lambda r: r.distance_meters)
+            logger.warning("Failed to calculate directional terrain metrics", error=str(e))
+
+    for (asset, asset_geom, distance_m), metrics in zip(matches, metrics_list):
+        results.append(ProximityResult(
+            asset_id=asset.get("assetId", "unknown"),
+            asset_name=asset.get("name", "Unknown"),
+            asset_type=asset.get("assetType", 0),
+            asset_type_name=asset.get("assetTypeName", "Unknown"),
+            criticality=asset.get("criticality", 1),
+            criticality_name=asset.get("criticalityName", "Medium"),
+            distance_meters=distance_m,
+            asset_geometry=asset_geom,
+            asset_elevation_m=metrics.asset_elevation_m if metrics else None,
+            elevation_diff_m=metrics.elevation_diff_m if metrics else None,
+            is_upslope=metrics.is_upslope if metrics else None,
+            slope_toward_asset_deg=metrics.slope_toward_asset_deg if metrics else None,
+        ))
 
     logger.info(
         "Proximity analysis complete",
@@ -208,29 +286,64 @@ def batch_proximity_analysis(
     max_distance_m: float = 2500.0,
     dem_data: Any = None,
     change_elevations: list[float | None] | None = None,
+    max_workers: int = 8,
 ) -> dict[int, list[ProximityResult]]:
     """Perform proximity analysis for multiple change polygons.
 
+    Polygons are analyzed concurrently on a thread pool against one shared,
+    read-only asset index; GEOS and PROJ calls release the GIL.
+
     Args:
         change_polygons: List of change polygon geometries.
         assets: List of asset dictionaries from the API.
         max_distance_m: Maximum distance in meters to search.
         dem_data: Optional DEMData object for terrain analysis.
         change_elevations: Optional list of pre-calculated elevations for each change polygon.
+        max_workers: Number of threads analyzing polygons.
 
     Returns:
         Dictionary mapping polygon index to list of ProximityResults.
     """
-    results = {}
+    results: dict[int, list[ProximityResult]] = {}
+    if not change_polygons or not assets:
+        return results
+
+    # Project and index the assets once, in the UTM zone of the polygons'
+    # mean centroid (polygons outside WGS84 fall back per call)
+    centroids = shapely.centroid(np.array(change_polygons, dtype=object))
+    center_x = float(np.nanmean(shapely.get_x(centroids)))
+    center_y = float(np.nanmean(shapely.get_y(centroids)))
+    if -180 <= center_x <= 180 and -90 <= center_y <= 90:
+        prepared = prepare_assets(assets, get_utm_transformer(center_x, center_y))
+    else:
+        prepared = prepare_assets(assets, None)
 
-    for idx, polygon in enumerate(change_polygons):
+    # Sample terrain at every change centroid in one DEM lookup
+    change_terrains: list["TerrainData | None"] = [None] * len(change_polygons)
+    if dem_data is not None and sample_terrain_at_points is not None:
+        try:
+            change_terrains = sample_terrain_at_points(
+                dem_data, shapely.get_x(centroids), shapely.get_y(centroids)
+            )
+        except Exception as e:
+            logger.warning("Failed to sample terrain at change centroids", error=str(e))
+
+    def analyze(idx: int) -> list[ProximityResult]:
         change_elev = (
             change_elevations[idx]
             if change_elevations and idx < len(change_elevations)
             else None
         )
-        nearby = find_nearby_assets(polygon, assets, max_distance_m, dem_data, change_elev)
-        if nearby:
-            results[idx] = nearby
+        return find_nearby_assets(
+            change_polygons[idx], assets, max_distance_m, dem_data, change_elev,
+            prepared_assets=prepared,
+            change_terrain=change_terrains[idx],
+        )
+
+    workers = min(max_workers, len(change_polygons))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for idx, nearby in enumerate(executor.map(analyze, range(len(change_polygons)))):
+            if nearby:
+                results[idx] = nearby
 
     return results
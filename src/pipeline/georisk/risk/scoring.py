@@ -1,19 +1,29 @@
 """Risk scoring model for change-asset proximity."""
 
-from dataclasses import dataclass, field
+import copy
+import math
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import structlog
 import yaml
 
 from georisk.raster.change import ChangePolygon
 from georisk.risk.proximity import ProximityResult
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoringFactor:
     """A single scoring factor contribution."""
 
@@ -32,9 +42,13 @@ class RiskScore:
     level: str
     factors: list[ScoringFactor] = field(default_factory=list)
 
-    @property
+    @cached_property
     def scoring_factors_dict(self) -> dict[str, Any]:
-        """Convert factors to dictionary for API submission."""
+        """Convert factors to dictionary for API submission.
+
+        Built on first access and cached; factors are not expected to change
+        once the score is calculated.
+        """
         return {
             "total_score": self.score,
             "risk_level": self.level,
@@ -159,6 +173,274 @@ DEFAULT_SCORING = {
 }
 
 
+# Compass directions for consecutive 45-degree sectors, starting at north
+_COMPASS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
+def _first_match_bins(
+    thresholds: list[float],
+    below: bool,
+) -> tuple[list[float], list[int]]:
+    """Reduce first-match thresholds to ascending bins for binary search.
+
+    Threshold lists are scanned in order and the first match wins. A
+    threshold matches x < t when below is True, x >= t otherwise.
+    Thresholds shadowed by an earlier, looser one can never match and are
+    dropped, so the rest form a sorted step function.
+
+    Args:
+        thresholds: Threshold values in config order.
+        below: Whether a threshold matches values below it.
+
+    Returns:
+        Tuple of (ascending bins, config index of each bin's threshold).
+    """
+    bins: list[float] = []
+    indices: list[int] = []
+    for i, t in enumerate(thresholds):
+        if not bins or (t > bins[-1] if below else t < bins[-1]):
+            bins.append(t)
+            indices.append(i)
+    if not below:
+        bins.reverse()
+        indices.reverse()
+    return bins, indices
+
+
+@dataclass(slots=True, frozen=True)
+class _ThresholdTable:
+    """A first-match threshold factor flattened for binary search."""
+
+    max_points: int
+    bins: tuple[float, ...]       # Ascending bins from _first_match_bins()
+    indices: tuple[int, ...]      # Config index of each bin's threshold
+    points: tuple[int, ...]       # Points per threshold, in config order
+    reason_codes: tuple[str, ...]  # Reason code per threshold, in config order
+    below: bool                   # Thresholds match x < t (else x >= t)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict[str, Any],
+        key: str,
+        below: bool,
+        sign: float = 1.0,
+    ) -> "_ThresholdTable":
+        """Build a table from a factor config with a "thresholds" list.
+
+        Args:
+            config: Factor config with "max_points" and "thresholds".
+            key: Threshold value key (e.g. "distance_m").
+            below: Whether thresholds match values below them.
+            sign: Multiplier applied to threshold values (-1 to search
+                negated values).
+
+        Returns:
+            _ThresholdTable for the factor.
+        """
+        thresholds = config["thresholds"]
+        bins, indices = _first_match_bins([sign * t[key] for t in thresholds], below)
+        return cls(
+            max_points=config["max_points"],
+            bins=tuple(bins),
+            indices=tuple(indices),
+            points=tuple(t["points"] for t in thresholds),
+            reason_codes=tuple(t["reason_code"] for t in thresholds),
+            below=below,
+        )
+
+    def match(self, value: float) -> int | None:
+        """Find the first threshold matching a value by binary search.
+
+        Args:
+            value: Value to look up; NaN never matches.
+
+        Returns:
+            Config index of the matching threshold, or None.
+        """
+        if math.isnan(value):
+            return None
+        pos = bisect_right(self.bins, value)
+        if self.below:
+            return self.indices[pos] if pos < len(self.bins) else None
+        return self.indices[pos - 1] if pos > 0 else None
+
+    def points_for(self, values: np.ndarray) -> np.ndarray:
+        """Look up first-match points for an array of values.
+
+        Args:
+            values: Values to score; NaN never matches.
+
+        Returns:
+            Integer array of points, 0 where no threshold matches.
+        """
+        # Trailing 0 is the no-match entry
+        table = np.array([self.points[i] for i in self.indices] + [0], dtype=np.int64)
+        pos = np.searchsorted(np.asarray(self.bins, dtype=np.float64), values, side="right")
+        if not self.below:
+            pos = np.where(pos > 0, pos - 1, len(self.bins))
+        pos = np.where(np.isnan(values), len(self.bins), pos)
+        return table[pos]
+
+
+@dataclass(slots=True, frozen=True)
+class _RangeTable:
+    """First-match [min_deg, max_deg) ranges flattened into interval lookups.
+
+    The sorted range boundaries cut the circle into intervals that each lie
+    wholly inside or outside every range, so the first matching range can
+    be resolved per interval ahead of time.
+    """
+
+    max_points: int
+    edges: tuple[float, ...]             # Sorted range boundaries
+    interval_ranges: tuple[int, ...]     # Range index per interval (-1 = none)
+    points: tuple[int, ...]              # Points per range, in config order
+    reason_codes: tuple[str, ...]        # Reason code per range, in config order
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "_RangeTable":
+        """Build a table from the aspect config.
+
+        Args:
+            config: Aspect config with optional "max_points" and "ranges".
+
+        Returns:
+            _RangeTable for the ranges.
+        """
+        ranges = config.get("ranges", [])
+        bounds = [(r.get("min_deg", 0), r.get("max_deg", 360)) for r in ranges]
+        edges = sorted({edge for bound in bounds for edge in bound})
+
+        interval_ranges = []
+        for start, stop in zip(edges, edges[1:]):
+            interval_ranges.append(next(
+                (i for i, (min_deg, max_deg) in enumerate(bounds)
+                 if min_deg <= start and stop <= max_deg),
+                -1,
+            ))
+
+        return cls(
+            max_points=config.get("max_points", 5),
+            edges=tuple(edges),
+            interval_ranges=tuple(interval_ranges),
+            points=tuple(r.get("points", 0) for r in ranges),
+            reason_codes=tuple(r.get("reason_code", "ASPECT_UNKNOWN") for r in ranges),
+        )
+
+    def match(self, value: float) -> int | None:
+        """Find the first range containing a value.
+
+        Args:
+            value: Value to look up; NaN never matches.
+
+        Returns:
+            Config index of the matching range, or None.
+        """
+        pos = bisect_right(self.edges, value) - 1
+        if 0 <= pos < len(self.interval_ranges) and self.interval_ranges[pos] >= 0:
+            return self.interval_ranges[pos]
+        return None
+
+    def points_for(self, values: np.ndarray) -> np.ndarray:
+        """Look up first-match range points for an array of values.
+
+        Args:
+            values: Values to score; NaN never matches.
+
+        Returns:
+            Integer array of points, 0 where no range matches.
+        """
+        # Trailing 0 is the no-match entry, also used below the first edge
+        table = np.array(
+            [self.points[i] if i >= 0 else 0 for i in self.interval_ranges] + [0],
+            dtype=np.int64,
+        )
+        no_match = len(self.interval_ranges)
+        pos = np.searchsorted(np.asarray(self.edges, dtype=np.float64), values, side="right") - 1
+        pos = np.where((pos < 0) | (pos >= no_match), no_match, pos)
+        return table[pos]
+
+
+@dataclass(slots=True, frozen=True)
+class _DirectionalSlope:
+    """Directional slope modifier parameters read once from config."""
+
+    max_points: int
+    upslope_threshold_m: float
+    downslope_threshold_m: float
+    upslope_base: float
+    upslope_range: float        # upslope max multiplier - base
+    upslope_elev_scale: float
+    downslope_base: float
+    downslope_range: float      # downslope base multiplier - min
+    downslope_elev_scale: float
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "_DirectionalSlope":
+        """Build from the directional slope config, applying defaults."""
+        upslope_base = config.get("upslope_multiplier_base", 1.5)
+        downslope_base = config.get("downslope_multiplier_base", 0.9)
+        return cls(
+            max_points=config.get("max_points", 20),
+            upslope_threshold_m=config.get("upslope_threshold_m", 5.0),
+            downslope_threshold_m=config.get("downslope_threshold_m", -5.0),
+            upslope_base=upslope_base,
+            upslope_range=config.get("upslope_multiplier_max", 2.5) - upslope_base,
+            upslope_elev_scale=config.get("upslope_elev_scale", 100),
+            downslope_base=downslope_base,
+            downslope_range=downslope_base - config.get("downslope_multiplier_min", 0.7),
+            downslope_elev_scale=config.get("downslope_elev_scale", 100),
+        )
+
+    def modifiers(self, elevation_diff_m: np.ndarray) -> np.ndarray:
+        """Directional modifiers for an array of elevation differences.
+
+        Both branches are evaluated for every element and selected with
+        np.where; NaN differences get the level modifier 1.0.
+
+        Args:
+            elevation_diff_m: Elevation differences (change - asset).
+
+        Returns:
+            Float array of slope point multipliers.
+        """
+        upslope = self.upslope_base + np.minimum(
+            self.upslope_range,
+            self.upslope_range * elevation_diff_m / self.upslope_elev_scale,
+        )
+        downslope = self.downslope_base - np.minimum(
+            self.downslope_range,
+            self.downslope_range * np.abs(elevation_diff_m) / self.downslope_elev_scale,
+        )
+        return np.where(
+            elevation_diff_m > self.upslope_threshold_m,
+            upslope,
+            np.where(elevation_diff_m < self.downslope_threshold_m, downslope, 1.0),
+        )
+
+
+# Parsed YAML scoring configs keyed by (path, mtime)
+_CONFIG_CACHE: dict[tuple[str, float], dict[str, Any] | None] = {}
+
+
+def _load_config_file(config_path: Path) -> dict[str, Any] | None:
+    """Load a YAML scoring config, reusing the parsed result while the file is unchanged.
+
+    Args:
+        config_path: Path to YAML configuration file.
+
+    Returns:
+        A copy of the parsed configuration, or None for an empty file.
+    """
+    key = (str(config_path), config_path.stat().st_mtime)
+    if key not in _CONFIG_CACHE:
+        with open(config_path) as f:
+            _CONFIG_CACHE[key] = yaml.load(f, Loader=_YamlLoader)
+    # Copy so merged settings never alias the cached dict
+    return copy.deepcopy(_CONFIG_CACHE[key])
+
+
 class RiskScorer:
     """Risk scoring engine with configurable thresholds."""
 
@@ -169,17 +451,49 @@ class RiskScorer:
             config: Scoring configuration dictionary.
             config_path: Path to YAML configuration file.
         """
-        self.config = DEFAULT_SCORING.copy()
+        # Deep copy: _merge_config() updates the nested factor dicts in place
+        self.config = copy.deepcopy(DEFAULT_SCORING)
 
         if config_path and config_path.exists():
-            with open(config_path) as f:
-                yaml_config = yaml.safe_load(f)
-                if yaml_config:
-                    self._merge_config(yaml_config)
+            yaml_config = _load_config_file(config_path)
+            if yaml_config:
+                self._merge_config(yaml_config)
 
         if config:
             self._merge_config(config)
 
+        self._freeze_config()
+
+    def _freeze_config(self) -> None:
+        """Flatten the merged config into lookup tables for the scoring hot path.
+
+        The config is read once here; changes to self.config afterwards are
+        not picked up.
+        """
+        self._distance = _ThresholdTable.from_config(
+            self.config["distance"], "distance_m", below=True
+        )
+        # ndvi <= delta is -ndvi >= -delta
+        self._ndvi = _ThresholdTable.from_config(
+            self.config["ndvi_drop"], "delta", below=False, sign=-1.0
+        )
+        self._area = _ThresholdTable.from_config(self.config["area"], "area_m2", below=False)
+        self._slope = _ThresholdTable.from_config(self.config["slope"], "slope_deg", below=False)
+        self._aspect = _RangeTable.from_config(self.config.get("aspect", {}))
+        self._directional = _DirectionalSlope.from_config(
+            self.config.get("directional_slope", self.config["slope"])
+        )
+
+        self._land_cover_multipliers = dict(
+            self.config.get("land_cover", {}).get("multipliers", {})
+        )
+        self._criticality_multipliers = dict(self.config["criticality"]["multipliers"])
+        self._criticality_max_points = self.config["criticality"]["max_points"]
+        self._risk_levels = tuple(
+            (level["min_score"], level["max_score"], level["name"])
+            for level in self.config["risk_levels"]
+        )
+
     def _merge_config(self, config: dict[str, Any]) -> None:
         """Merge configuration into current config."""
         for key in ["scoring_factors", "risk_levels"]:
@@ -312,19 +626,19 @@ class RiskScorer:
                     ls_mult = min(base_mult + upslope_boost, max_mult)
 
                 ls_delta = int(total_score * ls_mult) - total_score
-                ls_factor.points = ls_delta
+                ls_factor = replace(ls_factor, points=ls_delta)
                 total_score = int(total_score * ls_mult)
             factors.append(ls_factor)
 
         # Apply criticality multiplier
-        multiplier = self.config["criticality"]["multipliers"].get(proximity.criticality, 1.0)
+        multiplier = self._criticality_multipliers.get(proximity.criticality, 1.0)
         adjusted_score = int(min(100, total_score * multiplier))
 
         # Add criticality factor for transparency
         crit_factor = ScoringFactor(
             name="Criticality",
             points=int(total_score * (multiplier - 1)) if multiplier > 1 else 0,
-            max_points=self.config["criticality"]["max_points"],
+            max_points=self._criticality_max_points,
             reason_code=f"CRITICALITY_{proximity.criticality_name.upper()}",
             details=f"Multiplier: {multiplier}x for {proximity.criticality_name} criticality",
         )
@@ -339,20 +653,108 @@ class RiskScorer:
             factors=factors,
         )
 
+    def calculate_risk_scores_batch(
+        self,
+        changes: list[ChangePolygon],
+        proximities: list[ProximityResult],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate risk scores for many change-asset pairs at once.
+
+        Gives the same scores and levels as calculate_risk_score() for each
+        (changes[i], proximities[i]) pair, computed with array operations
+        and without building a factor breakdown.
+
+        Args:
+            changes: Detected change polygons.
+            proximities: Proximity results, aligned with changes.
+
+        Returns:
+            Tuple of (integer score array, risk level name array).
+        """
+        def column(values: Any) -> np.ndarray:
+            return np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+
+        distance = column(p.distance_meters for p in proximities)
+        ndvi_drop = column(c.ndvi_drop_mean for c in changes)
+        area = column(c.area_sq_meters for c in changes)
+        slope = column(c.slope_degree_mean for c in changes)
+        aspect = column(c.aspect_degrees for c in changes)
+        elev_diff = column(p.elevation_diff_m for p in proximities)
+        has_slope = np.array([c.slope_degree_mean is not None for c in changes], dtype=bool)
+        has_aspect = np.array([c.aspect_degrees is not None for c in changes], dtype=bool)
+        has_elev = np.array([p.elevation_diff_m is not None for p in proximities], dtype=bool)
+        is_landslide = np.array(
+            [c.change_type == "LandslideDebris" for c in changes], dtype=bool
+        )
+        lc_multiplier = column(
+            self._get_land_cover_multiplier(c.land_cover_class) for c in changes
+        )
+        crit_multiplier = column(
+            self._criticality_multipliers.get(p.criticality, 1.0) for p in proximities
+        )
+
+        # Threshold factors
+        total = self._distance.points_for(distance)
+        total += self._ndvi.points_for(-ndvi_drop)
+        total += self._area.points_for(area)
+
+        # Directional slope factor
+        base_points = self._slope.points_for(slope)
+        directional = self._directional
+        directional_points = np.minimum(
+            directional.max_points,
+            np.trunc(base_points * directional.modifiers(elev_diff)).astype(np.int64),
+        )
+        slope_points = np.where(has_elev, directional_points, base_points)
+        total += np.where(has_slope, slope_points, 0)
+
+        # Aspect factor
+        aspect_points = self._aspect.points_for(np.mod(aspect, 360))
+        total += np.where(has_aspect, aspect_points, 0)
+
+        # Land cover multiplier (skipped for confirmed landslides when < 1.0)
+        apply_lc = (lc_multiplier != 1.0) & ~(is_landslide & (lc_multiplier < 1.0))
+        total = np.where(apply_lc, np.trunc(total * lc_multiplier).astype(np.int64), total)
+
+        # Landslide multiplier
+        ls_config = self.config.get("landslide", {})
+        base_mult = ls_config.get("multiplier", 1.8)
+        upslope_mult = min(
+            base_mult + ls_config.get("upslope_boost", 0.5),
+            ls_config.get("max_multiplier", 2.5),
+        )
+        ls_slope = np.where(has_slope, slope, 0.0)
+        apply_ls = is_landslide & ~(ls_slope < ls_config.get("min_slope_deg", 15.0))
+        ls_mult = np.where(has_elev & (elev_diff > 5.0), upslope_mult, base_mult)
+        total = np.where(apply_ls, np.trunc(total * ls_mult).astype(np.int64), total)
+
+        # Criticality multiplier, capped at 100
+        scores = np.trunc(np.minimum(100, total * crit_multiplier)).astype(np.int64)
+
+        # Risk levels (first matching level wins)
+        levels = np.full(len(changes), "Unknown", dtype=object)
+        for min_score, max_score, name in reversed(self._risk_levels):
+            in_level = (min_score <= scores) & (scores <= max_score)
+            levels = np.where(in_level, name, levels)
+
+        return scores, levels
+
     def _score_distance(self, distance_m: float) -> ScoringFactor:
         """Score based on distance."""
-        config = self.config["distance"]
-        max_pts = config["max_points"]
-
-        for threshold in config["thresholds"]:
-            if distance_m < threshold["distance_m"]:
-                return ScoringFactor(
-                    name="Distance",
-                    points=threshold["points"],
-                    max_points=max_pts,
-                    reason_code=threshold["reason_code"],
-                    details=f"Distance: {distance_m:.0f}m",
-                )
+        table = self._distance
+        max_pts = table.max_points
+
+        idx = table.match(distance_m)
+        if idx is not None:
+            return ScoringFactor(
+                name="Distance",
+                points=table.points[idx],
+                max_points=max_pts,
+                reason_code=table.reason_codes[idx],
+                details=f"Distance: {distance_m:.0f}m",
+            )
 
         return ScoringFactor(
             name="Distance",
@@ -364,18 +766,18 @@ class RiskScorer:
 
     def _score_ndvi(self, ndvi_drop: float) -> ScoringFactor:
         """Score based on NDVI drop magnitude."""
-        config = self.config["ndvi_drop"]
-        max_pts = config["max_points"]
-
-        for threshold in config["thresholds"]:
-            if ndvi_drop <= threshold["delta"]:
-                return ScoringFactor(
-                    name="NDVI Drop",
-                    points=threshold["points"],
-                    max_points=max_pts,
-                    reason_code=threshold["reason_code"],
-                    details=f"NDVI drop: {ndvi_drop:.3f}",
-                )
+        table = self._ndvi
+        max_pts = table.max_points
+
+        idx = table.match(-ndvi_drop)
+        if idx is not None:
+            return ScoringFactor(
+                name="NDVI Drop",
+                points=table.points[idx],
+                max_points=max_pts,
+                reason_code=table.reason_codes[idx],
+                details=f"NDVI drop: {ndvi_drop:.3f}",
+            )
 
         return ScoringFactor(
             name="NDVI Drop",
@@ -387,18 +789,18 @@ class RiskScorer:
 
     def _score_area(self, area_m2: float) -> ScoringFactor:
         """Score based on change area."""
-        config = self.config["area"]
-        max_pts = config["max_points"]
-
-        for threshold in config["thresholds"]:
-            if area_m2 >= threshold["area_m2"]:
-                return ScoringFactor(
-                    name="Area",
-                    points=threshold["points"],
-                    max_points=max_pts,
-                    reason_code=threshold["reason_code"],
-                    details=f"Area: {area_m2:,.0f} m\u00b2",
-                )
+        table = self._area
+        max_pts = table.max_points
+
+        idx = table.match(area_m2)
+        if idx is not None:
+            return ScoringFactor(
+                name="Area",
+                points=table.points[idx],
+                max_points=max_pts,
+                reason_code=table.reason_codes[idx],
+                details=f"Area: {area_m2:,.0f} m\u00b2",
+            )
 
         return ScoringFactor(
             name="Area",
@@ -410,18 +812,18 @@ class RiskScorer:
 
     def _score_slope(self, slope_deg: float) -> ScoringFactor:
         """Score based on terrain slope (basic, without directional modifier)."""
-        config = self.config["slope"]
-        max_pts = config["max_points"]
-
-        for threshold in config["thresholds"]:
-            if slope_deg >= threshold["slope_deg"]:
-                return ScoringFactor(
-                    name="Slope",
-                    points=threshold["points"],
-                    max_points=max_pts,
-                    reason_code=threshold["reason_code"],
-                    details=f"Slope: {slope_deg:.1f}\u00b0",
-                )
+        table = self._slope
+        max_pts = table.max_points
+
+        idx = table.match(slope_deg)
+        if idx is not None:
+            return ScoringFactor(
+                name="Slope",
+                points=table.points[idx],
+                max_points=max_pts,
+                reason_code=table.reason_codes[idx],
+                details=f"Slope: {slope_deg:.1f}\u00b0",
+            )
 
         return ScoringFactor(
             name="Slope",
@@ -457,19 +859,17 @@ class RiskScorer:
         Returns:
             ScoringFactor with directional slope score.
         """
-        config = self.config.get("directional_slope", self.config["slope"])
-        max_pts = config.get("max_points", 20)
+        directional = self._directional
+        max_pts = directional.max_points
 
         # Calculate base slope score (0-10 points)
         base_points = 0
         base_reason = "SLOPE_FLAT"
 
-        slope_config = self.config["slope"]
-        for threshold in slope_config["thresholds"]:
-            if slope_deg >= threshold["slope_deg"]:
-                base_points = threshold["points"]
-                base_reason = threshold["reason_code"]
-                break
+        idx = self._slope.match(slope_deg)
+        if idx is not None:
+            base_points = self._slope.points[idx]
+            base_reason = self._slope.reason_codes[idx]
 
         # If no elevation data, return base slope score
         if elevation_diff_m is None:
@@ -482,35 +882,25 @@ class RiskScorer:
             )
 
         # Calculate directional modifier
-        upslope_threshold = config.get("upslope_threshold_m", 5.0)
-        downslope_threshold = config.get("downslope_threshold_m", -5.0)
-
-        if elevation_diff_m > upslope_threshold:
+        if elevation_diff_m > directional.upslope_threshold_m:
             # Change is upslope from asset - HIGHEST risk
             # Debris/erosion/landslide flows downhill toward asset
-            upslope_base = config.get("upslope_multiplier_base", 1.5)
-            upslope_max = config.get("upslope_multiplier_max", 2.5)
-            elev_scale = config.get("upslope_elev_scale", 100)
-
             # Scale from base to max based on elevation difference
-            modifier = upslope_base + min(
-                upslope_max - upslope_base,
-                (upslope_max - upslope_base) * elevation_diff_m / elev_scale,
+            modifier = directional.upslope_base + min(
+                directional.upslope_range,
+                directional.upslope_range * elevation_diff_m / directional.upslope_elev_scale,
             )
             direction = "UPSLOPE"
             direction_desc = f"upslope ({elevation_diff_m:.0f}m higher)"
 
-        elif elevation_diff_m < downslope_threshold:
+        elif elevation_diff_m < directional.downslope_threshold_m:
             # Change is downslope from asset - MODERATE risk
             # Fire spreads uphill toward asset, but debris flows away
-            downslope_base = config.get("downslope_multiplier_base", 0.9)
-            downslope_min = config.get("downslope_multiplier_min", 0.7)
-            elev_scale = config.get("downslope_elev_scale", 100)
-
             # Scale from base to min based on elevation difference
-            modifier = downslope_base - min(
-                downslope_base - downslope_min,
-                (downslope_base - downslope_min) * abs(elevation_diff_m) / elev_scale,
+            modifier = directional.downslope_base - min(
+                directional.downslope_range,
+                directional.downslope_range * abs(elevation_diff_m)
+                / directional.downslope_elev_scale,
             )
             direction = "DOWNSLOPE"
             direction_desc = f"downslope ({abs(elevation_diff_m):.0f}m lower)"
@@ -545,25 +935,21 @@ class RiskScorer:
         Returns:
             ScoringFactor with aspect score.
         """
-        config = self.config.get("aspect", {})
-        max_pts = config.get("max_points", 5)
-        ranges = config.get("ranges", [])
+        table = self._aspect
+        max_pts = table.max_points
 
         # Normalize to 0-360
         aspect = aspect_degrees % 360
 
-        for range_def in ranges:
-            min_deg = range_def.get("min_deg", 0)
-            max_deg = range_def.get("max_deg", 360)
-
-            if min_deg <= aspect < max_deg:
-                return ScoringFactor(
-                    name="Aspect",
-                    points=range_def.get("points", 0),
-                    max_points=max_pts,
-                    reason_code=range_def.get("reason_code", "ASPECT_UNKNOWN"),
-                    details=f"Aspect: {aspect:.0f}\u00b0 ({self._aspect_to_compass(aspect)})",
-                )
+        idx = table.match(aspect)
+        if idx is not None:
+            return ScoringFactor(
+                name="Aspect",
+                points=table.points[idx],
+                max_points=max_pts,
+                reason_code=table.reason_codes[idx],
+                details=f"Aspect: {aspect:.0f}\u00b0 ({self._aspect_to_compass(aspect)})",
+            )
 
         # Default for any unmatched range
         return ScoringFactor(
@@ -591,9 +977,7 @@ class RiskScorer:
         if land_cover_class is None:
             return 1.0
 
-        lc_config = self.config.get("land_cover", {})
-        multipliers = lc_config.get("multipliers", {})
-        return multipliers.get(land_cover_class, 1.0)
+        return self._land_cover_multipliers.get(land_cover_class, 1.0)
 
     def _score_landslide(
         self,
@@ -667,27 +1051,17 @@ class RiskScorer:
 
     def _aspect_to_compass(self, aspect: float) -> str:
         """Convert aspect degrees to compass direction."""
-        directions = [
-            (337.5, 360, "N"), (0, 22.5, "N"),
-            (22.5, 67.5, "NE"),
-            (67.5, 112.5, "E"),
-            (112.5, 157.5, "SE"),
-            (157.5, 202.5, "S"),
-            (202.5, 247.5, "SW"),
-            (247.5, 292.5, "W"),
-            (292.5, 337.5, "NW"),
-        ]
-        aspect = aspect % 360
-        for min_deg, max_deg, direction in directions:
-            if min_deg <= aspect < max_deg:
-                return direction
-        return "N"
+        if math.isnan(aspect):
+            return "N"
+        # 45-degree sectors centered on each direction; shifting by half a
+        # sector makes N span [337.5, 360) and [0, 22.5)
+        return _COMPASS[int((aspect % 360 + 22.5) // 45) % 8]
 
     def _get_risk_level(self, score: int) -> str:
         """Get risk level name from score."""
-        for level in self.config["risk_levels"]:
-            if level["min_score"] <= score <= level["max_score"]:
-                return level["name"]
+        for min_score, max_score, name in self._risk_levels:
+            if min_score <= score <= max_score:
+                return name
         return "Unknown"
 
 
@@ -697,5 +1071,10 @@ def calculate_risk_score(
     proximity: ProximityResult,
 ) -> RiskScore:
     """Calculate risk score using the default scorer."""
-    scorer = RiskScorer()
-    return scorer.calculate_risk_score(change, proximity)
+    return _default_scorer().calculate_risk_score(change, proximity)
+
+
+@lru_cache(maxsize=1)
+def _default_scorer() -> RiskScorer:
+    """Build the default-config scorer once per process."""
+    return RiskScorer()
@@ -1,8 +1,9 @@
 """Tests for change detection module, focusing on change classification."""
 
+import numpy as np
 import pytest
 
-from georisk.raster.change import ChangePolygon, _classify_change
+from georisk.raster.change import ChangePolygon, _classify_change, _classify_changes
 
 # ---------------------------------------------------------------------------
 # _classify_change without land cover context
@@ -57,6 +58,22 @@ class TestClassifyChangeWithoutLandCover:
         assert _classify_change(ndvi_drop) == expected
 
 
+# ---------------------------------------------------------------------------
+# _classify_changes (vectorized, no land cover)
+# ---------------------------------------------------------------------------
+
+class TestClassifyChangesVectorized:
+    """Tests that _classify_changes matches _classify_change element-wise."""
+
+    def test_matches_scalar_classification(self):
+        drops = np.array([-0.6, -0.4, -0.35, -0.2, -0.15, 0.0, 0.15, 0.2, 0.25, np.nan])
+        expected = [_classify_change(float(d)) for d in drops]
+        assert _classify_changes(drops).tolist() == expected
+
+    def test_empty_input(self):
+        assert _classify_changes(np.array([], dtype=np.float64)).tolist() == []
+
+
 # ---------------------------------------------------------------------------
 # _classify_change with land cover context
 # ---------------------------------------------------------------------------
@@ -5,7 +5,12 @@ without requiring PyTorch or TorchGeo to be installed.
 """
 
 import numpy as np
+import pytest
+import xarray as xr
+from pyproj import Transformer
+from shapely.geometry import Point, Polygon, box
 
+from georisk.geo_utils import patch_centers
 from georisk.raster.landcover import (
     EUROSAT_BANDS,
     EUROSAT_CLASSES,
@@ -13,7 +18,13 @@ from georisk.raster.landcover import (
     EUROSAT_NORMALIZE_DIVISOR,
     EUROSAT_PATCH_SIZE,
     LANDCOVER_RISK_MULTIPLIERS,
+    LandCoverModel,
+    LandCoverResult,
+    _extract_patch,
+    _extract_patches,
     _normalize_patch,
+    _upsample_to_grid,
+    classify_polygons_landcover,
     is_landcover_available,
 )
 
@@ -125,6 +136,250 @@ class TestNormalizePatch:
         np.testing.assert_allclose(result, 0.5, atol=1e-6)
 
 
+# ---------------------------------------------------------------------------
+# In-memory upsampling of coarse bands
+# ---------------------------------------------------------------------------
+
+def _grid(values, res, x0=500_000.0, y0=4_200_000.0, crs="EPSG:32610"):
+    """Build a north-up DataArray with pixel size res and top-left corner (x0, y0)."""
+    h, w = values.shape
+    da = xr.DataArray(
+        values,
+        dims=("y", "x"),
+        coords={
+            "y": y0 - res * (np.arange(h) + 0.5),
+            "x": x0 + res * (np.arange(w) + 0.5),
+        },
+    )
+    return da.rio.write_crs(crs)
+
+
+class TestUpsampleToGrid:
+    """Tests for _upsample_to_grid (nearest upsampling of 20m/60m bands)."""
+
+    def test_aligned_factor_of_two(self):
+        coarse = _grid(np.array([[1, 2], [3, 4]], dtype=np.uint16), res=20)
+        ref = _grid(np.zeros((4, 4), dtype=np.uint16), res=10)
+        result = _upsample_to_grid(coarse, ref)
+        np.testing.assert_array_equal(
+            result, np.kron([[1, 2], [3, 4]], np.ones((2, 2), dtype=np.uint16))
+        )
+
+    def test_reference_offset_by_one_fine_pixel(self):
+        coarse = _grid(np.array([[1, 2], [3, 4]], dtype=np.uint16), res=20)
+        ref = _grid(np.zeros((3, 3), dtype=np.uint16), res=10, x0=500_010.0, y0=4_199_990.0)
+        result = _upsample_to_grid(coarse, ref)
+        np.testing.assert_array_equal(result, [[1, 2, 2], [3, 4, 4], [3, 4, 4]])
+
+    def test_misaligned_grid_returns_none(self):
+        coarse = _grid(np.ones((2, 2), dtype=np.uint16), res=20)
+        ref = _grid(np.zeros((4, 4), dtype=np.uint16), res=10, x0=500_005.0)
+        assert _upsample_to_grid(coarse, ref) is None
+
+    def test_different_crs_returns_none(self):
+        coarse = _grid(np.ones((2, 2), dtype=np.uint16), res=20, crs="EPSG:32611")
+        ref = _grid(np.zeros((4, 4), dtype=np.uint16), res=10)
+        assert _upsample_to_grid(coarse, ref) is None
+
+
+# ---------------------------------------------------------------------------
+# Patch location and extraction
+# ---------------------------------------------------------------------------
+
+def _index_grid(h, w, res=1.0, x0=0.0, y0=0.0, ascending_y=False, crs="EPSG:4326"):
+    """Build a DataArray whose values are the flat pixel index row * w + col.
+
+    Pixel centers sit at x0 + res * (col + 0.5) and y0 -/+ res * (row + 0.5).
+    """
+    y_step = res if ascending_y else -res
+    da = xr.DataArray(
+        np.arange(h * w).reshape(h, w),
+        dims=("y", "x"),
+        coords={
+            "y": y0 + y_step * (np.arange(h) + 0.5),
+            "x": x0 + res * (np.arange(w) + 0.5),
+        },
+    )
+    return da.rio.write_crs(crs)
+
+
+def _nearest_pixel(grid, x, y):
+    """(row, col) of the pixel selected by a nearest-coordinate .sel lookup."""
+    return divmod(int(grid.sel(x=x, y=y, method="nearest")), grid.shape[1])
+
+
+class TestPatchCenters:
+    """Tests for patch_centers (centroid -> pixel lookup used by the classifiers)."""
+
+    # Inside the 8x6 raster plus points beyond each edge and corner
+    POINTS = [
+        (0.3, -0.2), (5.7, -7.9), (2.4, -3.6), (4.1, -6.5),
+        (-3.0, -2.2), (9.5, -4.4), (1.2, 2.0), (3.3, -15.0), (-1.0, 4.0),
+    ]
+
+    def test_matches_nearest_selection_descending_y(self):
+        grid = _index_grid(8, 6)
+        rows, cols = patch_centers(grid, [Point(x, y) for x, y in self.POINTS])
+        expected = [_nearest_pixel(grid, x, y) for x, y in self.POINTS]
+        assert list(zip(rows.tolist(), cols.tolist())) == expected
+
+    def test_matches_nearest_selection_ascending_y(self):
+        grid = _index_grid(8, 6, y0=-8.0, ascending_y=True)
+        rows, cols = patch_centers(grid, [Point(x, y) for x, y in self.POINTS])
+        expected = [_nearest_pixel(grid, x, y) for x, y in self.POINTS]
+        assert list(zip(rows.tolist(), cols.tolist())) == expected
+
+    def test_reprojects_wgs84_centroids_to_scene_crs(self):
+        grid = _index_grid(8, 6, res=10.0, x0=500_000.0, y0=4_200_000.0, crs="EPSG:32610")
+        to_wgs84 = Transformer.from_crs("EPSG:32610", "EPSG:4326", always_xy=True)
+        utm_points = [(500_013.0, 4_199_987.0), (500_047.0, 4_199_931.0), (499_900.0, 4_200_100.0)]
+
+        rows, cols = patch_centers(
+            grid, [Point(*to_wgs84.transform(x, y)) for x, y in utm_points]
+        )
+
+        expected = [_nearest_pixel(grid, x, y) for x, y in utm_points]
+        assert list(zip(rows.tolist(), cols.tolist())) == expected
+
+    def test_undefined_centroid_is_minus_one(self):
+        grid = _index_grid(4, 4)
+        rows, cols = patch_centers(grid, [Point(1.5, -1.5), Polygon()])
+        assert rows.tolist() == [1, -1]
+        assert cols.tolist() == [1, -1]
+
+
+class TestExtractPatches:
+    """Tests for _extract_patches (bulk gather with per-patch edge fallback)."""
+
+    def test_matches_single_patch_extraction(self):
+        """Interior, edge and corner centers match _extract_patch; -1 is skipped."""
+        h, w = 100, 90
+        scene = xr.DataArray(
+            np.arange(3 * h * w, dtype=np.uint16).reshape(3, h, w), dims=("band", "y", "x")
+        )
+        rows = np.array([50, 32, 68, 0, 99, 10, -1, 40, 99])
+        cols = np.array([45, 32, 58, 45, 89, 0, -1, 89, 0])
+
+        indices, patches = _extract_patches(scene, rows, cols)
+
+        assert indices.tolist() == [0, 1, 2, 3, 4, 5, 7, 8]
+        assert patches.shape == (8, 3, EUROSAT_PATCH_SIZE, EUROSAT_PATCH_SIZE)
+        assert patches.dtype == np.uint16
+        for i, patch in zip(indices.tolist(), patches):
+            np.testing.assert_array_equal(patch, _extract_patch(scene, rows[i], cols[i]))
+
+    def test_no_centers(self):
+        scene = xr.DataArray(np.zeros((2, 70, 70), dtype=np.uint16), dims=("band", "y", "x"))
+
+        indices, patches = _extract_patches(scene, np.array([-1]), np.array([-1]))
+
+        assert indices.size == 0
+        assert patches.shape == (0, 2, EUROSAT_PATCH_SIZE, EUROSAT_PATCH_SIZE)
+
+
+# ---------------------------------------------------------------------------
+# Batched classification
+# ---------------------------------------------------------------------------
+
+class CountingModel:
+    """Stub EuroSAT model that counts inputs and scores class 0 by the center pixel.
+
+    Logits are zero except class 0, which is band 0 at the patch center, so
+    each result's probabilities identify the pixel it was computed from.
+    """
+
+    def __init__(self):
+        self.num_inputs = 0
+
+    def __call__(self, tensor):
+        import torch
+
+        self.num_inputs += int(tensor.shape[0])
+        half = EUROSAT_PATCH_SIZE // 2
+        logits = torch.zeros((tensor.shape[0], len(EUROSAT_CLASSES)))
+        logits[:, 0] = tensor[:, 0, half, half]
+        return logits
+
+
+class TestClassifyPolygonsLandcover:
+    """Tests for classify_polygons_landcover() with a stub model."""
+
+    @pytest.fixture
+    def stub_model(self):
+        torch = pytest.importorskip("torch")
+        return LandCoverModel(
+            model=CountingModel(), model_version="stub-v1", device="cpu", dtype=torch.float32,
+        )
+
+    @staticmethod
+    def _scene(size=200):
+        """13-band WGS84 scene whose band 0 holds the flat pixel index."""
+        bands = np.zeros((len(EUROSAT_BANDS), size, size), dtype=np.uint16)
+        bands[0] = np.arange(size * size).reshape(size, size)
+        scene = xr.DataArray(
+            bands,
+            dims=("band", "y", "x"),
+            coords={
+                "band": np.arange(1, len(EUROSAT_BANDS) + 1),
+                "y": np.arange(size - 1, -1, -1, dtype=float),
+                "x": np.arange(size, dtype=float),
+            },
+        )
+        return scene.rio.write_crs("EPSG:4326")
+
+    def test_shared_centers_classified_once_and_fanned_out(self, stub_model):
+        """Polygons in the same center pixel share one result, in input order."""
+        scene = self._scene()
+        size = scene.shape[-1]
+        # Pixel (row, col) is centered at (x=col, y=size-1-row)
+        a = (50, 50)
+        b = (80, 120)
+
+        def around(center, r):
+            row, col = center
+            x, y = col, size - 1 - row
+            return box(x - r, y - r, x + r, y + r)
+
+        polygons = [around(a, 0.2), around(b, 0.2), around(a, 0.4), Polygon(), around(b, 0.1)]
+
+        results = classify_polygons_landcover(
+            scene, polygons, stub_model, input_size=EUROSAT_PATCH_SIZE,
+        )
+
+        assert stub_model.model.num_inputs == 2
+        assert results[3] is None
+        assert results[0] is results[2]
+        assert results[1] is results[4]
+        for result, (row, col) in ((results[0], a), (results[1], b)):
+            center_value = (row * size + col) / EUROSAT_NORMALIZE_DIVISOR
+            expected = np.exp(center_value) / (np.exp(center_value) + len(EUROSAT_CLASSES) - 1)
+            assert result.class_probabilities[EUROSAT_CLASSES[0]] == pytest.approx(
+                expected, rel=1e-5,
+            )
+            assert result.model_version == "stub-v1"
+
+    def test_empty_polygon_does_not_drop_the_batch(self, stub_model):
+        """An empty polygon is None while its neighbours are still classified."""
+        scene = self._scene()
+        polygons = [box(49.8, 149.8, 50.2, 150.2), Polygon(), box(119.8, 119.8, 120.2, 120.2)]
+
+        results = classify_polygons_landcover(
+            scene, polygons, stub_model, input_size=EUROSAT_PATCH_SIZE,
+        )
+
+        assert results[1] is None
+        assert isinstance(results[0], LandCoverResult)
+        assert isinstance(results[2], LandCoverResult)
+        assert stub_model.model.num_inputs == 2
+
+    def test_all_centers_undefined(self, stub_model):
+        """Without any defined center, no forward pass runs and all results are None."""
+        results = classify_polygons_landcover(self._scene(), [Polygon(), Polygon()], stub_model)
+
+        assert results == [None, None]
+        assert stub_model.model.num_inputs == 0
+
+
 # ---------------------------------------------------------------------------
 # Availability check
 # ---------------------------------------------------------------------------
@@ -3,16 +3,106 @@
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
+import rioxarray  # noqa: F401 - needed for .rio accessor on DataArrays
+import xarray as xr
+from shapely.geometry import Polygon, box
 
+from georisk.raster import landslide
 from georisk.raster.landslide import (
     LANDSLIDE_PATCH_SIZE,
     LANDSLIDE_SENTINEL_BANDS,
+    LandslideModel,
     LandslideResult,
     _ensure_model_cached,
+    _extract_patch_into,
     _normalize_landslide_patch,
+    classify_polygons_landslide,
     is_landslide_available,
 )
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+GRID_SIZE = 200
+
+
+def make_grid(values: np.ndarray) -> xr.DataArray:
+    """Wrap (H, W) or (bands, H, W) values in a WGS84 DataArray.
+
+    Pixel (row, col) is centered at (x=col, y=H-1-row) with 1-degree pixels.
+    """
+    rows, cols = values.shape[-2:]
+    coords = {
+        "y": np.arange(rows - 1, -1, -1, dtype=float),
+        "x": np.arange(cols, dtype=float),
+    }
+    dims = ["y", "x"]
+    if values.ndim == 3:
+        dims = ["band", *dims]
+        coords["band"] = np.arange(1, values.shape[0] + 1)
+    return xr.DataArray(values, dims=dims, coords=coords).rio.write_crs("EPSG:4326")
+
+
+def make_scene() -> tuple[xr.DataArray, dict[str, xr.DataArray]]:
+    """Build a 12-band scene and a flat DEM on the same grid.
+
+    Band 0 is a row-major ramp in [-0.5, 0.5), so every pixel is distinct;
+    all other channels are zero.
+    """
+    spectral = np.zeros((12, GRID_SIZE, GRID_SIZE), dtype=np.float32)
+    spectral[0] = np.arange(GRID_SIZE * GRID_SIZE).reshape(GRID_SIZE, GRID_SIZE)
+    spectral[0] = spectral[0] / (GRID_SIZE * GRID_SIZE) - 0.5
+    flat = np.zeros((GRID_SIZE, GRID_SIZE), dtype=np.float32)
+    dem = {"slope": make_grid(flat), "elevation": make_grid(flat.copy())}
+    return make_grid(spectral), dem
+
+
+def pixel_box(row: int, col: int):
+    """A small WGS84 box whose centroid is the center of pixel (row, col)."""
+    x, y = col, GRID_SIZE - 1 - row
+    return box(x - 0.25, y - 0.25, x + 0.25, y + 0.25)
+
+
+def expected_max_probability(scene: xr.DataArray, row: int, col: int) -> float:
+    """Sigmoid of the largest band-0 value in the zero-padded patch at (row, col)."""
+    half = LANDSLIDE_PATCH_SIZE // 2
+    window = scene.values[0, max(0, row - half):row + half, max(0, col - half):col + half]
+    peak = float(window.max())
+    if window.shape != (LANDSLIDE_PATCH_SIZE, LANDSLIDE_PATCH_SIZE):
+        peak = max(peak, 0.0)
+    return 1.0 / (1.0 + np.exp(-peak))
+
+
+class RecordingModel:
+    """Stub segmentation model that returns the first input channel as logits."""
+
+    def __init__(self, fail_on_call: int | None = None):
+        self.batch_sizes: list[int] = []
+        self.fail_on_call = fail_on_call
+
+    def __call__(self, tensor):
+        self.batch_sizes.append(int(tensor.shape[0]))
+        if len(self.batch_sizes) == self.fail_on_call:
+            raise RuntimeError("forward pass failed")
+        return tensor[:, :1]
+
+
+@pytest.fixture
+def stub_model() -> LandslideModel:
+    """A CPU LandslideModel around RecordingModel with identity normalization."""
+    pytest.importorskip("torch")
+    return LandslideModel(
+        model=RecordingModel(),
+        model_version="stub-v1",
+        device="cpu",
+        normalization_means=[0.0] * 14,
+        normalization_stds=[1.0] * 14,
+        patch_size=LANDSLIDE_PATCH_SIZE,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -114,6 +204,59 @@ class TestNormalizeLandslidePatch:
         np.testing.assert_allclose(result[10:], 0.0, atol=1e-6)
 
 
+# ---------------------------------------------------------------------------
+# Patch extraction
+# ---------------------------------------------------------------------------
+
+class TestExtractPatchInto:
+    """Tests for _extract_patch_into()."""
+
+    def test_interior_window_copied_exactly(self):
+        """A window fully inside the raster fills the whole patch."""
+        data = np.arange(3 * GRID_SIZE * GRID_SIZE, dtype=np.float32).reshape(
+            3, GRID_SIZE, GRID_SIZE
+        )
+        out = np.zeros((3, LANDSLIDE_PATCH_SIZE, LANDSLIDE_PATCH_SIZE), dtype=np.float32)
+
+        _extract_patch_into(data, 100, 100, out)
+
+        np.testing.assert_array_equal(out, data[:, 36:164, 36:164])
+
+    def test_corner_window_is_centered_and_zero_padded(self):
+        """A window clipped by the top-right corner is centered with zero padding."""
+        data = np.arange(1, GRID_SIZE * GRID_SIZE + 1, dtype=np.float32).reshape(
+            GRID_SIZE, GRID_SIZE
+        )
+        out = np.zeros((LANDSLIDE_PATCH_SIZE, LANDSLIDE_PATCH_SIZE), dtype=np.float32)
+
+        # Rows 0..74 and cols 126..200 are available: a 74x74 region
+        _extract_patch_into(data, 10, 190, out)
+
+        expected = np.zeros_like(out)
+        expected[27:101, 27:101] = data[0:74, 126:200]
+        np.testing.assert_array_equal(out, expected)
+
+    def test_raster_smaller_than_patch(self):
+        """A raster smaller than the patch is placed in the middle, rest stays zero."""
+        data = np.arange(1, 101, dtype=np.float32).reshape(10, 10)
+        out = np.zeros((LANDSLIDE_PATCH_SIZE, LANDSLIDE_PATCH_SIZE), dtype=np.float32)
+
+        _extract_patch_into(data, 0, 0, out)
+
+        np.testing.assert_array_equal(out[59:69, 59:69], data)
+        assert out.sum() == data.sum()
+
+    def test_casts_into_float32_output(self):
+        """Integer reflectance is written into the float32 buffer."""
+        data = np.full((GRID_SIZE, GRID_SIZE), 1234, dtype=np.uint16)
+        out = np.zeros((LANDSLIDE_PATCH_SIZE, LANDSLIDE_PATCH_SIZE), dtype=np.float32)
+
+        _extract_patch_into(data, 100, 100, out)
+
+        assert out.dtype == np.float32
+        np.testing.assert_array_equal(out, 1234.0)
+
+
 # ---------------------------------------------------------------------------
 # LandslideResult dataclass
 # ---------------------------------------------------------------------------
@@ -211,3 +354,118 @@ class TestEnsureModelCached:
             result = _ensure_model_cached(model_file)
 
         assert result is None
+
+
+# ---------------------------------------------------------------------------
+# Batched classification
+# ---------------------------------------------------------------------------
+
+class TestClassifyPolygonsLandslide:
+    """Tests for classify_polygons_landslide() with a stub model."""
+
+    def test_batches_split_at_batch_size(self, stub_model):
+        """Five patches with batch_size=2 run as 2 + 2 + 1, each result on its polygon."""
+        scene, dem = make_scene()
+        centers = [(100, 100), (70, 130), (130, 70), (90, 110), (110, 90)]
+
+        results = classify_polygons_landslide(
+            scene, dem, [pixel_box(r, c) for r, c in centers], stub_model, batch_size=2,
+        )
+
+        assert stub_model.model.batch_sizes == [2, 2, 1]
+        for result, (row, col) in zip(results, centers):
+            assert result.model_version == "stub-v1"
+            assert result.max_probability == pytest.approx(
+                expected_max_probability(scene, row, col), rel=1e-5,
+            )
+
+    def test_results_in_input_order_with_skipped_polygons(self, stub_model):
+        """Polygons without a centroid stay None and do not shift later results."""
+        scene, dem = make_scene()
+        polygons = [pixel_box(0, 0), Polygon(), pixel_box(GRID_SIZE - 1, GRID_SIZE - 1)]
+
+        results = classify_polygons_landslide(scene, dem, polygons, stub_model)
+
+        assert results[1] is None
+        assert results[0].max_probability == pytest.approx(
+            expected_max_probability(scene, 0, 0), rel=1e-5,
+        )
+        assert results[2].max_probability == pytest.approx(
+            expected_max_probability(scene, GRID_SIZE - 1, GRID_SIZE - 1), rel=1e-5,
+        )
+        assert stub_model.model.batch_sizes == [2]
+
+    def test_failed_batch_leaves_its_polygons_none(self, stub_model):
+        """A forward-pass failure only drops the polygons in that batch."""
+        stub_model.model = RecordingModel(fail_on_call=2)
+        scene, dem = make_scene()
+        centers = [(100, 100), (70, 130), (130, 70)]
+
+        results = classify_polygons_landslide(
+            scene, dem, [pixel_box(r, c) for r, c in centers], stub_model, batch_size=2,
+        )
+
+        assert results[0] is not None
+        assert results[1] is not None
+        assert results[2] is None
+
+    def test_empty_polygon_list(self, stub_model):
+        """No polygons yields no results and no forward passes."""
+        scene, dem = make_scene()
+
+        assert classify_polygons_landslide(scene, dem, [], stub_model) == []
+        assert stub_model.model.batch_sizes == []
+
+    def test_failed_assembly_only_affects_that_polygon(self, stub_model, monkeypatch):
+        """An exception while assembling one patch leaves just that polygon None."""
+        scene, dem = make_scene()
+        centers = [(100, 100), (70, 130), (130, 70)]
+        assemble = landslide._assemble_input
+
+        def flaky_assemble(arrays, row, col):
+            if (row, col) == (70, 130):
+                raise ValueError("corrupt patch")
+            return assemble(arrays, row, col)
+
+        monkeypatch.setattr(landslide, "_assemble_input", flaky_assemble)
+
+        results = classify_polygons_landslide(
+            scene, dem, [pixel_box(r, c) for r, c in centers], stub_model, max_workers=2,
+        )
+
+        assert results[1] is None
+        for i in (0, 2):
+            assert results[i].max_probability == pytest.approx(
+                expected_max_probability(scene, *centers[i]), rel=1e-5,
+            )
+        assert stub_model.model.batch_sizes == [2]
+
+    def test_empty_polygon_only_affects_that_polygon(self, stub_model):
+        """An empty polygon is None while the valid polygons around it are classified."""
+        scene, dem = make_scene()
+        centers = [(100, 100), (130, 70)]
+        polygons = [pixel_box(*centers[0]), Polygon(), pixel_box(*centers[1])]
+
+        results = classify_polygons_landslide(scene, dem, polygons, stub_model)
+
+        assert results[1] is None
+        for result, center in zip((results[0], results[2]), centers):
+            assert result.max_probability == pytest.approx(
+                expected_max_probability(scene, *center), rel=1e-5,
+            )
+
+    def test_patch_location_failure_returns_all_none(self, stub_model, monkeypatch):
+        """If patch centers cannot be located, every polygon is None instead of raising."""
+        scene, dem = make_scene()
+
+        def fail(*args, **kwargs):
+            raise ValueError("no transform")
+
+        monkeypatch.setattr(landslide, "patch_centers", fail)
+
+        results = classify_polygons_landslide(
+            scene, dem, [pixel_box(100, 100), pixel_box(50, 50)], stub_model,
+        )
+
+        assert results == [None, None]
+        assert stub_model.model.batch_sizes == []
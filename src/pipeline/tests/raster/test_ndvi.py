@@ -496,9 +496,8 @@ class TestStatisticsExcludeNodata:
     def test_stats_with_custom_nodata_within_range(self):
         """When nodata_value is within [-1,1], stats should still exclude it.
 
-        Note: The implementation excludes pixels whose value equals nodata_value.
-        With nodata_value=0.5, any pixel that genuinely computes to 0.5 would
-        also be excluded. This test uses inputs that avoid that ambiguity.
+        Only pixels with a zero denominator are excluded, so a pixel that
+        genuinely computes to nodata_value still counts.
         """
         # Build array where one pixel has zero denominator.
         # Use nodata_value=0.5 which won't collide with other NDVI values.
@@ -530,6 +529,29 @@ class TestStatisticsExcludeNodata:
         expected_mean = (p00 + p10 + p11) / 3
         assert abs(result.mean_value - expected_mean) < 1e-4
 
+    def test_stats_include_valid_pixels_equal_to_nodata(self):
+        """Equal bands give a genuine NDVI of 0, which stays in the stats."""
+        red_vals = np.array(
+            [[250, 0],
+             [100, 100]],
+            dtype=np.float32,
+        )
+        nir_vals = np.array(
+            [[250, 0],
+             [400, 400]],
+            dtype=np.float32,
+        )
+        red = make_band(red_vals)
+        nir = make_band(nir_vals)
+
+        result = calculate_ndvi(red, nir, nodata_value=0.0)
+
+        veg = (400 - 100) / (400 + 100)  # 0.6
+        # Only (0,1) has a zero denominator; (0,0) is a valid 0.0
+        assert abs(result.min_value - 0.0) < 1e-5
+        assert abs(result.max_value - veg) < 1e-5
+        assert abs(result.mean_value - (0.0 + veg + veg) / 3) < 1e-5
+
     def test_single_valid_pixel(self):
         """When only one pixel is valid, stats should reflect that pixel alone."""
         # 2x2 array: only one non-zero denominator pixel
@@ -553,6 +575,28 @@ class TestStatisticsExcludeNodata:
         assert abs(result.max_value - expected) < 1e-5
         assert abs(result.mean_value - expected) < 1e-5
 
+    def test_stats_skip_nan_input_pixels(self):
+        """A NaN input pixel is left out of the stats instead of poisoning them."""
+        red_vals = np.array(
+            [[100, np.nan],
+             [100, 0]],
+            dtype=np.float32,
+        )
+        nir_vals = np.array(
+            [[300, 300],
+             [300, 0]],
+            dtype=np.float32,
+        )
+        red = make_band(red_vals)
+        nir = make_band(nir_vals)
+
+        result = calculate_ndvi(red, nir, nodata_value=0.0)
+
+        assert np.isnan(result.data.values[0, 1])
+        assert result.min_value == pytest.approx(0.5)
+        assert result.max_value == pytest.approx(0.5)
+        assert result.mean_value == pytest.approx(0.5)
+
 
 # ---------------------------------------------------------------------------
 # Parametrized edge case tests
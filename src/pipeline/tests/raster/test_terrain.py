@@ -0,0 +1,237 @@
+"""Unit tests for the terrain analysis module."""
+
+import numpy as np
+import pytest
+import rioxarray  # noqa: F401 - needed for .rio accessor on DataArrays
+import xarray as xr
+from shapely.geometry import Point, box
+
+from georisk.raster import terrain
+from georisk.raster.terrain import (
+    DEMData,
+    calculate_slope_aspect,
+    extract_terrain_stats_for_polygon,
+    sample_terrain_at_point,
+    sample_terrain_at_points,
+)
+
+
+def make_dem(elevation: np.ndarray, **layers: np.ndarray) -> DEMData:
+    """Create a WGS84 DEMData with 1-degree pixels centered on integer coords.
+
+    Args:
+        elevation: 2D elevation array; row 0 is the northernmost row.
+        **layers: Optional "slope" / "aspect" arrays of the same shape.
+
+    Returns:
+        DEMData whose pixel (row, col) is centered at (x=col, y=rows-1-row).
+    """
+    rows, cols = elevation.shape
+
+    def to_da(values: np.ndarray) -> xr.DataArray:
+        da = xr.DataArray(
+            values,
+            dims=["y", "x"],
+            coords={
+                "y": np.arange(rows - 1, -1, -1, dtype=float),
+                "x": np.arange(cols, dtype=float),
+            },
+        )
+        return da.rio.write_crs("EPSG:4326")
+
+    elev_da = to_da(elevation)
+    return DEMData(
+        elevation=elev_da,
+        slope=to_da(layers["slope"]) if "slope" in layers else None,
+        aspect=to_da(layers["aspect"]) if "aspect" in layers else None,
+        crs=elev_da.rio.crs,
+        transform=elev_da.rio.transform(),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Slope and aspect
+# ---------------------------------------------------------------------------
+
+class TestCalculateSlopeAspect:
+    """Tests for calculate_slope_aspect() (Horn algorithm, 10m cells)."""
+
+    def test_flat_dem_has_zero_slope(self):
+        """A flat DEM has zero slope everywhere."""
+        dem = make_dem(np.full((5, 5), 250.0, dtype=np.float32))
+
+        result = calculate_slope_aspect(dem)
+
+        np.testing.assert_allclose(result.slope.values, 0.0, atol=1e-6)
+
+    def test_eastward_ramp(self):
+        """Elevation rising 10m per 10m cell eastward gives a 45 degree slope."""
+        elevation = np.tile(np.arange(6, dtype=np.float32) * 10.0, (6, 1))
+        dem = make_dem(elevation)
+
+        result = calculate_slope_aspect(dem)
+
+        interior = (slice(1, -1), slice(1, -1))
+        np.testing.assert_allclose(result.slope.values[interior], 45.0, atol=1e-4)
+        np.testing.assert_allclose(result.aspect.values[interior], 90.0, atol=1e-4)
+
+    def test_outputs_are_float32_on_elevation_grid(self):
+        """Slope/aspect share the elevation coords and are float32."""
+        dem = make_dem(np.arange(16, dtype=np.float32).reshape(4, 4))
+
+        result = calculate_slope_aspect(dem)
+
+        assert result.slope.dtype == np.float32
+        assert result.aspect.dtype == np.float32
+        assert result.slope.shape == (4, 4)
+        np.testing.assert_array_equal(result.slope.x, dem.elevation.x)
+
+    def test_nan_elevation_preserved(self):
+        """Cells without elevation have NaN slope and aspect."""
+        elevation = np.full((4, 4), 100.0, dtype=np.float32)
+        elevation[1, 2] = np.nan
+        dem = make_dem(elevation)
+
+        result = calculate_slope_aspect(dem)
+
+        assert np.isnan(result.slope.values[1, 2])
+        assert np.isnan(result.aspect.values[1, 2])
+        assert np.isfinite(result.slope.values[0, 0])
+
+    def test_row_blocks_match_single_pass(self, monkeypatch: pytest.MonkeyPatch):
+        """Processing in small row blocks gives the same result as one block."""
+        rng = np.random.default_rng(0)
+        elevation = rng.uniform(0, 500, size=(11, 7)).astype(np.float32)
+        elevation[4, 3] = np.nan
+        dem = make_dem(elevation)
+
+        expected = calculate_slope_aspect(dem)
+        monkeypatch.setattr(terrain, "_SLOPE_BLOCK_ROWS", 3)
+        result = calculate_slope_aspect(dem)
+
+        np.testing.assert_allclose(result.slope.values, expected.slope.values, equal_nan=True)
+        np.testing.assert_allclose(result.aspect.values, expected.aspect.values, equal_nan=True)
+
+
+# ---------------------------------------------------------------------------
+# Point sampling
+# ---------------------------------------------------------------------------
+
+class TestSampleTerrainAtPoints:
+    """Tests for sample_terrain_at_points()."""
+
+    def test_matches_nearest_selection(self):
+        """Each point should sample the pixel with the nearest center."""
+        elevation = np.arange(12, dtype=np.float32).reshape(3, 4)
+        dem = make_dem(elevation)
+        xs = [0.0, 3.2, 1.6, 2.4]
+        ys = [2.0, 0.1, 1.4, 0.6]
+
+        results = sample_terrain_at_points(dem, xs, ys)
+
+        expected = [
+            float(dem.elevation.sel(x=x, y=y, method="nearest").values)
+            for x, y in zip(xs, ys)
+        ]
+        assert [r.elevation_m for r in results] == expected
+
+    def test_points_outside_dem_are_clamped_to_edge(self):
+        """Points beyond the raster sample the nearest edge pixel."""
+        elevation = np.arange(12, dtype=np.float32).reshape(3, 4)
+        dem = make_dem(elevation)
+
+        results = sample_terrain_at_points(dem, [-5.0, 10.0], [10.0, -5.0])
+
+        assert results[0].elevation_m == elevation[0, 0]
+        assert results[1].elevation_m == elevation[2, 3]
+
+    def test_nan_elevation_returns_none(self):
+        """Pixels without elevation yield None."""
+        elevation = np.ones((2, 2), dtype=np.float32)
+        elevation[0, 1] = np.nan
+        dem = make_dem(elevation)
+
+        results = sample_terrain_at_points(dem, [1.0, 0.0], [1.0, 1.0])
+
+        assert results[0] is None
+        assert results[1].elevation_m == 1.0
+
+    def test_slope_and_aspect_sampled_with_nan_as_zero(self):
+        """Slope/aspect come from their layers; NaN becomes 0.0."""
+        elevation = np.full((2, 2), 100.0, dtype=np.float32)
+        slope = np.array([[5.0, np.nan], [15.0, 20.0]], dtype=np.float32)
+        aspect = np.array([[90.0, 180.0], [np.nan, 0.0]], dtype=np.float32)
+        dem = make_dem(elevation, slope=slope, aspect=aspect)
+
+        results = sample_terrain_at_points(dem, [0.0, 1.0, 0.0], [1.0, 1.0, 0.0])
+
+        assert [r.slope_degrees for r in results] == [5.0, 0.0, 15.0]
+        assert [r.aspect_degrees for r in results] == [90.0, 180.0, 0.0]
+
+    def test_missing_slope_aspect_default_to_zero(self):
+        """Without slope/aspect layers, both default to 0.0."""
+        dem = make_dem(np.full((2, 2), 50.0, dtype=np.float32))
+
+        result = sample_terrain_at_points(dem, [0.0], [0.0])[0]
+
+        assert result.slope_degrees == 0.0
+        assert result.aspect_degrees == 0.0
+
+    def test_empty_input(self):
+        """No points yields an empty list."""
+        dem = make_dem(np.ones((2, 2), dtype=np.float32))
+
+        assert sample_terrain_at_points(dem, [], []) == []
+
+    def test_single_point_wrapper(self):
+        """sample_terrain_at_point should agree with the batched sampler."""
+        elevation = np.arange(9, dtype=np.float32).reshape(3, 3)
+        dem = make_dem(elevation)
+
+        result = sample_terrain_at_point(dem, Point(2.0, 0.0))
+
+        assert result.elevation_m == elevation[2, 2]
+
+
+# ---------------------------------------------------------------------------
+# Polygon statistics
+# ---------------------------------------------------------------------------
+
+class TestExtractTerrainStatsForPolygon:
+    """Tests for extract_terrain_stats_for_polygon()."""
+
+    def test_stats_cover_only_pixels_inside_polygon(self):
+        """Stats use pixels whose centers fall inside the polygon, ignoring NaN."""
+        elevation = np.arange(9, dtype=np.float32).reshape(3, 3)
+        slope = np.array(
+            [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0], [10.0, np.nan, 50.0]], dtype=np.float32
+        )
+        aspect = np.array(
+            [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [80.0, 100.0, 0.0]], dtype=np.float32
+        )
+        dem = make_dem(elevation, slope=slope, aspect=aspect)
+
+        # Bottom row, first two pixels (centers at (0, 0) and (1, 0))
+        stats = extract_terrain_stats_for_polygon(dem, box(-0.5, -0.5, 1.5, 0.5))
+
+        assert stats["elevation_m"] == pytest.approx(6.5)
+        assert stats["slope_degree_mean"] == pytest.approx(10.0)
+        assert stats["slope_degree_max"] == pytest.approx(10.0)
+        assert stats["aspect_degrees"] == pytest.approx(90.0, abs=1e-4)
+
+    def test_polygon_outside_dem_gives_defaults(self):
+        """A polygon with no pixels inside falls back to zeros."""
+        dem = make_dem(
+            np.ones((3, 3), dtype=np.float32),
+            slope=np.ones((3, 3), dtype=np.float32),
+            aspect=np.ones((3, 3), dtype=np.float32),
+        )
+
+        stats = extract_terrain_stats_for_polygon(dem, box(20.0, 20.0, 21.0, 21.0))
+
+        assert stats == {
+            "elevation_m": 0.0,
+            "slope_degree_mean": 0.0,
+            "slope_degree_max": 0.0,
+            "aspect_degrees": 0.0,
+        }
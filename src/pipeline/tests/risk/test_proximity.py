@@ -0,0 +1,270 @@
+"""Tests for the asset proximity analysis module."""
+
+import numpy as np
+import pytest
+from pyproj import Transformer
+from shapely.geometry import LineString, Point, box, mapping, shape
+from shapely.ops import transform
+
+from georisk.geo_utils import get_utm_crs, get_utm_transformer
+from georisk.risk.proximity import (
+    OVERHEAD_LINE_TYPES,
+    batch_proximity_analysis,
+    find_nearby_assets,
+    prepare_assets,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+CENTER_LON, CENTER_LAT = -121.6, 39.75
+
+
+def _asset(asset_id, geometry, asset_type_name="Building"):
+    """Build an API-style asset dict with a GeoJSON geometry."""
+    return {
+        "assetId": asset_id,
+        "name": f"Asset {asset_id}",
+        "assetType": 0,
+        "assetTypeName": asset_type_name,
+        "criticality": 1,
+        "criticalityName": "Medium",
+        "geometry": mapping(geometry) if geometry is not None else None,
+    }
+
+
+def _change(lon, lat, half_size=0.002):
+    """A small square change polygon centered on (lon, lat)."""
+    return box(lon - half_size, lat - half_size, lon + half_size, lat + half_size)
+
+
+def _random_assets(seed=0, count=300):
+    """Mixed points, footprints and lines scattered ~10km around the center.
+
+    Includes overhead lines, non-WGS84 assets and assets without geometry,
+    all of which must be skipped.
+    """
+    rng = np.random.default_rng(seed)
+    assets = []
+    for i in range(count):
+        lon = CENTER_LON + rng.uniform(-0.1, 0.1)
+        lat = CENTER_LAT + rng.uniform(-0.1, 0.1)
+        kind = i % 5
+        if kind == 0:
+            assets.append(_asset(f"pt-{i}", Point(lon, lat)))
+        elif kind == 1:
+            assets.append(_asset(f"bldg-{i}", box(lon, lat, lon + 0.0005, lat + 0.0004)))
+        elif kind == 2:
+            line = LineString([(lon, lat), (lon + 0.01, lat + 0.005)])
+            type_name = "TransmissionLine" if i % 2 else "Road"
+            assets.append(_asset(f"line-{i}", line, type_name))
+        elif kind == 3:
+            assets.append(_asset(f"tower-{i}", Point(lon, lat), "TransmissionLine"))
+        else:
+            assets.append(_asset(f"pt-{i}", Point(lon, lat)))
+    assets.append(_asset("projected", Point(500_000.0, 4_400_000.0)))
+    assets.append(_asset("no-geometry", None))
+    return assets
+
+
+def _reference_nearby(change_polygon, assets, max_distance_m):
+    """Brute-force (asset_id, distance) pairs using one transform per geometry."""
+    centroid = change_polygon.centroid
+    to_utm = Transformer.from_crs(
+        4326, get_utm_crs(centroid.x, centroid.y), always_xy=True
+    )
+    change_projected = transform(to_utm.transform, change_polygon)
+
+    matches = []
+    for asset in assets:
+        if not asset["geometry"]:
+            continue
+        geom = shape(asset["geometry"])
+        if (geom.geom_type in ("LineString", "MultiLineString")
+                and asset["assetTypeName"] in OVERHEAD_LINE_TYPES):
+            continue
+        minx, miny, maxx, maxy = geom.bounds
+        if minx < -180 or maxx > 180 or miny < -90 or maxy > 90:
+            continue
+        distance_m = change_projected.distance(transform(to_utm.transform, geom))
+        if distance_m <= max_distance_m:
+            matches.append((asset["assetId"], distance_m))
+
+    # Python's sort is stable, so equal distances keep asset order
+    matches.sort(key=lambda match: match[1])
+    return matches
+
+
+def _assert_matches_reference(results, expected):
+    assert [r.asset_id for r in results] == [asset_id for asset_id, _ in expected]
+    assert [r.distance_meters for r in results] == pytest.approx(
+        [distance for _, distance in expected], rel=1e-12, abs=1e-9,
+    )
+
+
+# ---------------------------------------------------------------------------
+# prepare_assets
+# ---------------------------------------------------------------------------
+
+class TestPrepareAssets:
+    """Tests for prepare_assets()."""
+
+    def test_skips_overhead_lines_invalid_and_missing_geometries(self):
+        assets = [
+            _asset("overhead", LineString([(-121.6, 39.75), (-121.5, 39.8)]), "TransmissionLine"),
+            _asset("tower", Point(-121.6, 39.75), "TransmissionLine"),
+            _asset("road", LineString([(-121.6, 39.75), (-121.5, 39.8)]), "Road"),
+            _asset("projected", Point(500_000.0, 4_400_000.0)),
+            _asset("no-geometry", None),
+            _asset("building", box(-121.61, 39.74, -121.6, 39.75)),
+        ]
+
+        prepared = prepare_assets(assets, get_utm_transformer(CENTER_LON, CENTER_LAT))
+
+        assert [a["assetId"] for a in prepared.assets] == ["tower", "road", "building"]
+        assert len(prepared.geometries) == len(prepared.projected) == 3
+
+    def test_projects_with_transformer(self):
+        to_utm = get_utm_transformer(CENTER_LON, CENTER_LAT)
+
+        prepared = prepare_assets([_asset("pt", Point(CENTER_LON, CENTER_LAT))], to_utm)
+
+        x, y = to_utm.transform(CENTER_LON, CENTER_LAT)
+        assert prepared.projected[0].equals(Point(x, y))
+        assert prepared.geometries[0].equals(Point(CENTER_LON, CENTER_LAT))
+
+    def test_without_transformer_keeps_geometries(self):
+        prepared = prepare_assets([_asset("pt", Point(CENTER_LON, CENTER_LAT))], None)
+
+        assert prepared.to_projected is None
+        assert prepared.projected[0].equals(Point(CENTER_LON, CENTER_LAT))
+
+
+# ---------------------------------------------------------------------------
+# find_nearby_assets
+# ---------------------------------------------------------------------------
+
+class TestFindNearbyAssets:
+    """Tests for find_nearby_assets() (STRtree candidates + exact distances)."""
+
+    @pytest.mark.parametrize("max_distance_m", [1000.0, 2500.0, 8000.0])
+    def test_matches_brute_force_reference(self, max_distance_m):
+        assets = _random_assets()
+        change = _change(CENTER_LON + 0.01, CENTER_LAT - 0.02)
+
+        results = find_nearby_assets(change, assets, max_distance_m)
+
+        _assert_matches_reference(results, _reference_nearby(change, assets, max_distance_m))
+
+    def test_search_radius_boundary_is_inclusive(self):
+        """An asset exactly at max_distance_m is kept; any closer radius drops it."""
+        change = _change(CENTER_LON, CENTER_LAT)
+        # Diagonal offset, so the asset sits near the corner of the query box
+        assets = [_asset("edge", Point(CENTER_LON + 0.015, CENTER_LAT + 0.012))]
+        [found] = find_nearby_assets(change, assets, max_distance_m=1e6)
+        distance_m = found.distance_meters
+
+        at_radius = find_nearby_assets(change, assets, max_distance_m=distance_m)
+        inside_radius = find_nearby_assets(change, assets, max_distance_m=distance_m * 0.999999)
+
+        assert [r.asset_id for r in at_radius] == ["edge"]
+        assert inside_radius == []
+
+    def test_skips_overhead_lines_and_non_wgs84_assets(self):
+        change = _change(CENTER_LON, CENTER_LAT)
+        line = LineString([(CENTER_LON - 0.01, CENTER_LAT), (CENTER_LON + 0.01, CENTER_LAT)])
+        assets = [
+            _asset("overhead", line, "TransmissionLine"),
+            _asset("road", line, "Road"),
+            _asset("tower", Point(CENTER_LON, CENTER_LAT + 0.003), "TransmissionLine"),
+            _asset("projected", Point(500_000.0, 4_400_000.0)),
+            _asset("no-geometry", None),
+        ]
+
+        results = find_nearby_assets(change, assets, max_distance_m=1_000_000.0)
+
+        assert {r.asset_id for r in results} == {"road", "tower"}
+
+    def test_equal_distances_keep_asset_order(self):
+        change = _change(CENTER_LON, CENTER_LAT)
+        near = Point(CENTER_LON + 0.004, CENTER_LAT)
+        far = Point(CENTER_LON + 0.008, CENTER_LAT)
+        assets = [
+            _asset("far-a", far),
+            _asset("tie-b", near),
+            _asset("tie-a", near),
+            _asset("far-b", far),
+        ]
+
+        results = find_nearby_assets(change, assets)
+
+        assert [r.asset_id for r in results] == ["tie-b", "tie-a", "far-a", "far-b"]
+        reversed_results = find_nearby_assets(change, assets[::-1])
+        assert [r.asset_id for r in reversed_results] == ["tie-a", "tie-b", "far-b", "far-a"]
+
+    def test_prepared_assets_give_same_results(self):
+        assets = _random_assets(seed=1)
+        change = _change(CENTER_LON - 0.03, CENTER_LAT + 0.01)
+        prepared = prepare_assets(assets, get_utm_transformer(CENTER_LON, CENTER_LAT))
+
+        assert find_nearby_assets(change, assets, prepared_assets=prepared) == (
+            find_nearby_assets(change, assets)
+        )
+
+    def test_non_wgs84_change_polygon_uses_unprojected_assets(self):
+        """A projected change polygon falls back to planar distances on raw coordinates.
+
+        Prepared assets projected to UTM must be rebuilt without a
+        transformer rather than compared against the raw polygon.
+        """
+        change = box(1_000.0, 1_000.0, 1_010.0, 1_010.0)
+        asset_geom = Point(CENTER_LON, CENTER_LAT)
+        assets = [_asset("pt", asset_geom)]
+        prepared = prepare_assets(assets, get_utm_transformer(CENTER_LON, CENTER_LAT))
+
+        with_prepared = find_nearby_assets(
+            change, assets, max_distance_m=1e7, prepared_assets=prepared
+        )
+        without_prepared = find_nearby_assets(change, assets, max_distance_m=1e7)
+
+        assert with_prepared == without_prepared
+        assert [r.distance_meters for r in with_prepared] == [change.distance(asset_geom)]
+
+    def test_no_assets(self):
+        assert find_nearby_assets(_change(CENTER_LON, CENTER_LAT), []) == []
+
+
+# ---------------------------------------------------------------------------
+# batch_proximity_analysis
+# ---------------------------------------------------------------------------
+
+class TestBatchProximityAnalysis:
+    """Tests for batch_proximity_analysis() (shared index across threads)."""
+
+    def test_matches_per_polygon_reference(self):
+        assets = _random_assets(seed=2)
+        rng = np.random.default_rng(3)
+        polygons = [
+            _change(CENTER_LON + dx, CENTER_LAT + dy)
+            for dx, dy in rng.uniform(-0.08, 0.08, size=(20, 2))
+        ]
+        # Far from every asset, so it has no entry in the result
+        polygons.append(_change(CENTER_LON + 1.0, CENTER_LAT + 1.0))
+
+        results = batch_proximity_analysis(polygons, assets, max_distance_m=2500.0, max_workers=4)
+
+        assert len(polygons) - 1 not in results
+        for idx, polygon in enumerate(polygons):
+            expected = _reference_nearby(polygon, assets, 2500.0)
+            if not expected:
+                assert idx not in results
+                continue
+            _assert_matches_reference(results[idx], expected)
+
+    def test_empty_inputs(self):
+        polygon = _change(CENTER_LON, CENTER_LAT)
+        assets = [_asset("pt", Point(CENTER_LON, CENTER_LAT))]
+
+        assert batch_proximity_analysis([], assets) == {}
+        assert batch_proximity_analysis([polygon], []) == {}
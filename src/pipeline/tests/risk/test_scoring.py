@@ -1,5 +1,7 @@
 """Tests for the risk scoring module."""
 
+import os
+
 import pytest
 from shapely.geometry import Point, Polygon
 
@@ -511,6 +513,24 @@ class TestCustomConfig:
         mid = scorer._score_distance(500)
         assert mid.points == 25
 
+    def test_unordered_thresholds_keep_first_match(self):
+        """Thresholds are matched in config order, even when not sorted."""
+        scorer = RiskScorer(config={
+            "scoring_factors": {
+                "area": {
+                    "thresholds": [
+                        {"area_m2": 10000, "points": 8, "reason_code": "AREA_GT_10000M2"},
+                        {"area_m2": 50000, "points": 15, "reason_code": "SHADOWED"},
+                        {"area_m2": 5000, "points": 4, "reason_code": "AREA_GT_5000M2"},
+                    ],
+                },
+            },
+        })
+
+        assert scorer._score_area(60000).reason_code == "AREA_GT_10000M2"
+        assert scorer._score_area(7000).reason_code == "AREA_GT_5000M2"
+        assert scorer._score_area(1000).reason_code == "AREA_SMALL"
+
     def test_custom_config_changes_distance_scoring(self):
         """A config that changes distance thresholds should be reflected in scoring."""
         scorer = RiskScorer(config={
@@ -544,6 +564,26 @@ class TestCustomConfig:
         assert distance_factor.points == 50
         assert distance_factor.reason_code == "CUSTOM_CLOSE"
 
+    def test_config_file_reloaded_when_modified(self, tmp_path):
+        """A YAML config is reused while unchanged and re-read after it is modified."""
+        config_path = tmp_path / "scoring.yaml"
+
+        def write_config(points: int, mtime: int) -> None:
+            config_path.write_text(
+                "scoring_factors:\n"
+                "  distance:\n"
+                "    thresholds:\n"
+                f"      - {{distance_m: 500, points: {points}, reason_code: CUSTOM}}\n"
+            )
+            os.utime(config_path, (mtime, mtime))
+
+        write_config(points=7, mtime=1_000_000)
+        assert RiskScorer(config_path=config_path)._score_distance(100).points == 7
+        assert RiskScorer(config_path=config_path)._score_distance(100).points == 7
+
+        write_config(points=9, mtime=2_000_000)
+        assert RiskScorer(config_path=config_path)._score_distance(100).points == 9
+
 
 # ---------------------------------------------------------------------------
 # Criticality multiplier
@@ -1013,3 +1053,50 @@ class TestLandslideScoring:
 
         result = scorer.calculate_risk_score(change, proximity)
         assert result.score <= 100
+
+
+# ---------------------------------------------------------------------------
+# Batch scoring
+# ---------------------------------------------------------------------------
+
+class TestBatchScoring:
+    """Tests for RiskScorer.calculate_risk_scores_batch."""
+
+    PAIRS = [
+        (_make_change(), _make_proximity()),
+        (_make_change(slope_degree_mean=None, aspect_degrees=None),
+         _make_proximity(distance_meters=3000.0, elevation_diff_m=None)),
+        (_make_change(ndvi_drop_mean=-0.6, area_sq_meters=60000, aspect_degrees=370.0),
+         _make_proximity(distance_meters=50.0, criticality=3, criticality_name="Critical")),
+        (_make_change(slope_degree_mean=12.0, aspect_degrees=45.0),
+         _make_proximity(elevation_diff_m=-80.0, criticality=0, criticality_name="Low")),
+        (_make_change(land_cover_class="AnnualCrop"), _make_proximity(elevation_diff_m=2.0)),
+        (_make_change(land_cover_class="Forest"), _make_proximity(distance_meters=100.0)),
+        (_make_change(change_type="LandslideDebris", land_cover_class="Highway"),
+         _make_proximity(elevation_diff_m=300.0)),
+        (_make_change(change_type="LandslideDebris", slope_degree_mean=10.0),
+         _make_proximity(elevation_diff_m=None)),
+        (_make_change(change_type="LandslideDebris", slope_degree_mean=16.0,
+                      ndvi_drop_mean=-0.15, area_sq_meters=3000),
+         _make_proximity(distance_meters=800.0, elevation_diff_m=0.0, criticality=2,
+                         criticality_name="High")),
+    ]
+
+    def test_matches_scalar_scoring(self):
+        """Batch scores and levels equal calculate_risk_score() pair by pair."""
+        scorer = RiskScorer()
+        changes = [c for c, _ in self.PAIRS]
+        proximities = [p for _, p in self.PAIRS]
+
+        scores, levels = scorer.calculate_risk_scores_batch(changes, proximities)
+
+        expected = [scorer.calculate_risk_score(c, p) for c, p in self.PAIRS]
+        assert scores.tolist() == [r.score for r in expected]
+        assert levels.tolist() == [r.level for r in expected]
+
+    def test_empty_batch(self):
+        """No pairs yields empty arrays."""
+        scores, levels = RiskScorer().calculate_risk_scores_batch([], [])
+
+        assert len(scores) == 0
+        assert len(levels) == 0